@@ -14,8 +14,11 @@ from reviews.models.wiki import Wiki
 class FlaggedRevsStatisticsModelTests(TestCase):
     """Tests for FlaggedRevsStatistics model."""
 
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wikipedia",
             code="test",
             api_endpoint="https://test.wikipedia.org/w/api.php",
@@ -77,8 +80,11 @@ class FlaggedRevsStatisticsModelTests(TestCase):
 class ReviewActivityModelTests(TestCase):
     """Tests for ReviewActivity model."""
 
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wikipedia",
             code="test",
             api_endpoint="https://test.wikipedia.org/w/api.php",
@@ -129,13 +135,17 @@ class ReviewActivityModelTests(TestCase):
 class StatisticsAPITests(TestCase):
     """Tests for statistics API endpoints."""
 
-    def setUp(self):
-        self.wiki1 = Wiki.objects.create(
+    wiki1: Wiki
+    wiki2: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki1 = Wiki.objects.create(
             name="Test Wikipedia 1",
             code="test1",
             api_endpoint="https://test1.wikipedia.org/w/api.php",
         )
-        self.wiki2 = Wiki.objects.create(
+        cls.wiki2 = Wiki.objects.create(
             name="Test Wikipedia 2",
             code="test2",
             api_endpoint="https://test2.wikipedia.org/w/api.php",
@@ -143,7 +153,7 @@ class StatisticsAPITests(TestCase):
 
         # Create some test data
         FlaggedRevsStatistics.objects.create(
-            wiki=self.wiki1,
+            wiki=cls.wiki1,
             date=date(2024, 1, 1),
             total_pages_ns0=1000,
             synced_pages_ns0=800,
@@ -151,7 +161,7 @@ class StatisticsAPITests(TestCase):
             pending_lag_average=2.5,
         )
         FlaggedRevsStatistics.objects.create(
-            wiki=self.wiki2,
+            wiki=cls.wiki2,
             date=date(2024, 1, 1),
             total_pages_ns0=2000,
             synced_pages_ns0=1800,
@@ -218,15 +228,18 @@ class StatisticsAPITests(TestCase):
 class ReviewActivityAPITests(TestCase):
     """Tests for review activity API endpoint."""
 
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wikipedia",
             code="test",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
 
         ReviewActivity.objects.create(
-            wiki=self.wiki,
+            wiki=cls.wiki,
             date=date(2024, 1, 1),
             number_of_reviewers=10,
             number_of_reviews=50,
@@ -279,8 +292,11 @@ class StatisticsPageTests(TestCase):
 class LoadStatisticsCommandTests(TestCase):
     """Tests for load_statistics management command."""
 
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wikipedia",
             code="test",
             api_endpoint="https://test.wikipedia.org/w/api.php",
@@ -335,14 +351,18 @@ class LoadStatisticsCommandTests(TestCase):
 class StatisticsAPIIntegrationTests(TestCase):
     """Integration tests for statistics API endpoints."""
 
-    def setUp(self):
+    wiki1: Wiki
+    wiki2: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.wiki1 = Wiki.objects.create(
+        cls.wiki1 = Wiki.objects.create(
             name="Finnish Wikipedia",
             code="fi",
             api_endpoint="https://fi.wikipedia.org/w/api.php",
         )
-        self.wiki2 = Wiki.objects.create(
+        cls.wiki2 = Wiki.objects.create(
             name="German Wikipedia",
             code="de",
             api_endpoint="https://de.wikipedia.org/w/api.php",
@@ -350,7 +370,7 @@ class StatisticsAPIIntegrationTests(TestCase):
 
         # Create statistics data
         FlaggedRevsStatistics.objects.create(
-            wiki=self.wiki1,
+            wiki=cls.wiki1,
             date=date(2024, 1, 1),
             total_pages_ns0=1000,
             synced_pages_ns0=800,
@@ -358,7 +378,7 @@ class StatisticsAPIIntegrationTests(TestCase):
             pending_lag_average=2.5,
         )
         FlaggedRevsStatistics.objects.create(
-            wiki=self.wiki2,
+            wiki=cls.wiki2,
             date=date(2024, 1, 1),
             total_pages_ns0=2000,
             synced_pages_ns0=1800,
@@ -368,14 +388,14 @@ class StatisticsAPIIntegrationTests(TestCase):
 
         # Create review activity data
         ReviewActivity.objects.create(
-            wiki=self.wiki1,
+            wiki=cls.wiki1,
             date=date(2024, 1, 1),
             number_of_reviewers=10,
             number_of_reviews=50,
             number_of_pages=45,
         )
         ReviewActivity.objects.create(
-            wiki=self.wiki2,
+            wiki=cls.wiki2,
             date=date(2024, 1, 1),
             number_of_reviewers=15,
             number_of_reviews=75,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 from review_statistics.models import (
     ReviewStatisticsCache,
@@ -13,14 +13,17 @@ from reviews.models import Wiki, WikiConfiguration
 
 
 class StatisticsModelTests(TestCase):
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        WikiConfiguration.objects.create(wiki=self.wiki)
+        WikiConfiguration.objects.create(wiki=cls.wiki)
 
     def test_review_statistics_cache_creation(self):
         """Test creating a review statistics cache entry."""
@@ -52,15 +55,17 @@ class StatisticsModelTests(TestCase):
 
 
 class StatisticsViewTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        WikiConfiguration.objects.create(wiki=self.wiki)
+        WikiConfiguration.objects.create(wiki=cls.wiki)
 
     def test_api_statistics_empty(self):
         """Test statistics API with no data."""
@@ -178,14 +183,17 @@ class StatisticsViewTests(TestCase):
 
 
 class StatisticsServiceTests(TestCase):
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        WikiConfiguration.objects.create(wiki=self.wiki)
+        WikiConfiguration.objects.create(wiki=cls.wiki)
 
     @mock.patch("review_statistics.services.SupersetQuery")
     def test_fetch_review_statistics(self, mock_superset):
@@ -254,22 +262,24 @@ class StatisticsServiceTests(TestCase):
 
 
 class StatisticsFilteringTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        WikiConfiguration.objects.create(wiki=self.wiki)
+        WikiConfiguration.objects.create(wiki=cls.wiki)
 
         # Create some test data
         from reviews.models import EditorProfile
 
         # Create auto-reviewer profile
         EditorProfile.objects.create(
-            wiki=self.wiki,
+            wiki=cls.wiki,
             username="AutoUser",
             usergroups=["autoreview"],
             is_autoreviewed=True,
@@ -278,7 +288,7 @@ class StatisticsFilteringTests(TestCase):
         # Create statistics entries
         base_time = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
         ReviewStatisticsCache.objects.create(
-            wiki=self.wiki,
+            wiki=cls.wiki,
             reviewer_name="Reviewer1",
             reviewed_user_name="AutoUser",
             page_title="Page1",
@@ -290,7 +300,7 @@ class StatisticsFilteringTests(TestCase):
             review_delay_days=2,
         )
         ReviewStatisticsCache.objects.create(
-            wiki=self.wiki,
+            wiki=cls.wiki,
             reviewer_name="Reviewer1",
             reviewed_user_name="RegularUser",
             page_title="Page2",
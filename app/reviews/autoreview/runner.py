@@ -7,12 +7,29 @@ from .checks import get_enabled_checks
 from .context import CheckContext
 from .decision import AutoreviewDecision
 from .utils.redirect import get_redirect_aliases
-from .utils.user import normalize_to_lookup
+from .utils.user import is_bot_user, normalize_to_lookup
 
 if TYPE_CHECKING:
     from reviews.models import EditorProfile, PendingPage, PendingRevision
     from reviews.services import WikiClient
 
+# Decisions are frozen, so the pipeline's fixed outcomes are shared across revisions.
+AUTOPATROL_APPROVAL = AutoreviewDecision(
+    status="approve",
+    label="Would be auto-approved",
+    reason="The user has autopatrol rights that allow auto-approval.",
+)
+DRY_RUN_MANUAL_REVIEW = AutoreviewDecision(
+    status="manual",
+    label="Requires human review",
+    reason="In dry-run mode the edit would not be approved automatically.",
+)
+
+
+def _ns_to_ms(duration_ns: int) -> float:
+    """Convert a nanosecond duration to the milliseconds reported by the API."""
+    return duration_ns / 1_000_000
+
 
 def run_checks_pipeline(
     revision: PendingRevision,
@@ -23,8 +40,13 @@ def run_checks_pipeline(
     blocking_categories: dict[str, str],
     redirect_aliases: list[str],
 ) -> dict:
-    """Run all enabled checks in order, stopping at blocking/approving checks."""
-    pipeline_start_time = time.perf_counter()
+    """
+    Run all enabled checks in order, stopping at blocking/approving checks.
+
+    Durations are integer nanoseconds; they are converted to milliseconds only when
+    run_autoreview_for_page builds the API payload.
+    """
+    pipeline_start_ns = time.perf_counter_ns()
 
     context = CheckContext(
         revision=revision,
@@ -40,9 +62,9 @@ def run_checks_pipeline(
 
     tests = []
     for check_info in checks_to_run:
-        check_start_time = time.perf_counter()
+        check_start_ns = time.perf_counter_ns()
         result = check_info["function"](context)
-        duration_ms = (time.perf_counter() - check_start_time) * 1000
+        duration_ns = time.perf_counter_ns() - check_start_ns
 
         tests.append(
             {
@@ -50,16 +72,16 @@ def run_checks_pipeline(
                 "title": result.check_title,
                 "status": result.status,
                 "message": result.message,
-                "duration_ms": duration_ms,
+                "duration_ns": duration_ns,
             }
         )
 
         if result.should_stop:
-            total_duration_ms = (time.perf_counter() - pipeline_start_time) * 1000
+            total_duration_ns = time.perf_counter_ns() - pipeline_start_ns
             return {
                 "tests": tests,
                 "decision": result.decision,
-                "total_duration_ms": total_duration_ms,
+                "total_duration_ns": total_duration_ns,
             }
 
         if (
@@ -68,26 +90,18 @@ def run_checks_pipeline(
             and profile
             and profile.is_autopatrolled
         ):
-            total_duration_ms = (time.perf_counter() - pipeline_start_time) * 1000
+            total_duration_ns = time.perf_counter_ns() - pipeline_start_ns
             return {
                 "tests": tests,
-                "decision": AutoreviewDecision(
-                    status="approve",
-                    label="Would be auto-approved",
-                    reason="The user has autopatrol rights that allow auto-approval.",
-                ),
-                "total_duration_ms": total_duration_ms,
+                "decision": AUTOPATROL_APPROVAL,
+                "total_duration_ns": total_duration_ns,
             }
 
-    total_duration_ms = (time.perf_counter() - pipeline_start_time) * 1000
+    total_duration_ns = time.perf_counter_ns() - pipeline_start_ns
     return {
         "tests": tests,
-        "decision": AutoreviewDecision(
-            status="manual",
-            label="Requires human review",
-            reason="In dry-run mode the edit would not be approved automatically.",
-        ),
-        "total_duration_ms": total_duration_ms,
+        "decision": DRY_RUN_MANUAL_REVIEW,
+        "total_duration_ns": total_duration_ns,
     }
 
 
@@ -115,6 +129,17 @@ def run_autoreview_for_page(page: PendingPage) -> list[dict]:
     blocking_categories = normalize_to_lookup(configuration.blocking_categories)
     redirect_aliases = get_redirect_aliases(page.wiki)
     client = WikiClient(page.wiki)
+    enabled_check_ids = {check["id"] for check in get_enabled_checks(configuration)}
+    if "blocked-user" in enabled_check_ids:
+        # The block check looks up each editor in turn; answer those lookups up front.
+        # Bot edits are approved by the bot check first, so they never need one.
+        skip_bots = "bot-user" in enabled_check_ids
+        client.prefetch_user_blocks(
+            (revision.user_name, revision.timestamp)
+            for revision in revisions
+            if revision.user_name
+            and not (skip_bots and is_bot_user(revision, profiles.get(revision.user_name)))
+        )
 
     results = []
     for revision in revisions:
@@ -127,16 +152,19 @@ def run_autoreview_for_page(page: PendingPage) -> list[dict]:
             blocking_categories=blocking_categories,
             redirect_aliases=redirect_aliases,
         )
+        tests = revision_result["tests"]
+        for test in tests:
+            test["duration_ms"] = _ns_to_ms(test.pop("duration_ns"))
         results.append(
             {
                 "revid": revision.revid,
-                "tests": revision_result["tests"],
+                "tests": tests,
                 "decision": {
                     "status": revision_result["decision"].status,
                     "label": revision_result["decision"].label,
                     "reason": revision_result["decision"].reason,
                 },
-                "total_duration_ms": revision_result["total_duration_ms"],
+                "total_duration_ms": _ns_to_ms(revision_result["total_duration_ns"]),
             }
         )
 
@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 
 if TYPE_CHECKING:
     from reviews.models import PendingRevision
@@ -15,24 +17,124 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Elements whose content is not shown as article text or contains legitimate syntax examples.
+NON_VISIBLE_TAGS = ("script", "style", "code", "pre", "tt", "syntaxhighlight")
+
+# Rendered HTML shorter than this cannot hold article text: MediaWiki's parser output
+# wrapper alone is longer, so such pages are blank and are not analysed further.
+MIN_HTML_LENGTH = 50
+
+# Substrings of the raw HTML that mark math content without needing a parsed tree.
+MATH_TEXT_MARKERS = ("\\", "$", "<math")
+
+# Compiled once; matches math elements and elements with a math class at any depth.
+MATH_XPATH = etree.XPath(
+    "boolean(descendant-or-self::math"
+    " | descendant-or-self::*[contains(translate(@class, 'MATH', 'math'), 'math')])"
+)
+
+# Indicators counted as literal substrings of the visible text.
+LITERAL_INDICATORS = ("{{", "}}", "[[", "]]")
+
+# Tag indicators matched case-insensitively on the decoded text. They stay str patterns:
+# in a bytes pattern \b treats non-ASCII letters as non-word characters.
+TAG_INDICATOR_PATTERNS = {
+    "<ref": re.compile(r"<ref\b", re.IGNORECASE),
+    "</ref": re.compile(r"</ref>", re.IGNORECASE),
+    "ref>": re.compile(r"\bref>", re.IGNORECASE),
+    "<div": re.compile(r"<div\b", re.IGNORECASE),
+    "</div": re.compile(r"</div>", re.IGNORECASE),
+    "div>": re.compile(r"\bdiv>", re.IGNORECASE),
+    "<span": re.compile(r"<span\b", re.IGNORECASE),
+    "</span": re.compile(r"</span>", re.IGNORECASE),
+    "span>": re.compile(r"\bspan>", re.IGNORECASE),
+}
+
+# File/Image/Category keywords by language code, used to spot broken media/category syntax.
+MEDIA_KEYWORDS = {
+    "en": ("File", "Image", "Category"),
+    "de": ("Datei", "Bild", "Kategorie"),
+    "fr": ("Fichier", "Image", "Catégorie"),
+    "es": ("Archivo", "Imagen", "Categoría"),
+    "it": ("File", "Immagine", "Categoria"),
+    "pt": ("Ficheiro", "Imagem", "Categoria"),
+    "pl": ("Plik", "Grafika", "Kategoria"),
+    "ru": ("Файл", "Изображение", "Категория"),
+    "ja": ("ファイル", "画像", "カテゴリ"),
+    "zh": ("文件", "图像", "分类"),
+    "hu": ("Fájl", "Kép", "Kategória"),  # Hungarian
+    "nl": ("Bestand", "Afbeelding", "Categorie"),  # Dutch
+    "sv": ("Fil", "Bild", "Kategori"),  # Swedish
+    "fi": ("Tiedosto", "Kuva", "Luokka"),  # Finnish
+    "no": ("Fil", "Bilde", "Kategori"),  # Norwegian
+    "da": ("Fil", "Billede", "Kategori"),  # Danish
+    "cs": ("Soubor", "Obrázek", "Kategorie"),  # Czech
+    "tr": ("Dosya", "Resim", "Kategori"),  # Turkish
+    "ar": ("ملف", "صورة", "تصنيف"),  # Arabic
+    "ko": ("파일", "그림", "분류"),  # Korean
+}
+
+
+def _parse_tree(html_content: str) -> lxml.html.HtmlElement | None:
+    """Parse rendered HTML into an lxml tree, returning None for empty or invalid input."""
+    if not html_content:
+        return None
+
+    try:
+        return lxml.html.fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _visible_text_from_tree(tree: lxml.html.HtmlElement) -> str:
+    """Strip non-visible elements from a parsed tree and return its text."""
+    # A single-element fragment is returned as the root itself, which strip_elements skips.
+    if tree.tag in NON_VISIBLE_TAGS:
+        return ""
+
+    # Remove script, style, code, pre, and tt tags (they contain legitimate syntax examples).
+    # The text following each removed element is kept, as it belongs to the parent.
+    etree.strip_elements(tree, *NON_VISIBLE_TAGS, with_tail=False)
+
+    return str(tree.text_content())
+
+
+def _has_math_markup(html_content: str, tree: lxml.html.HtmlElement) -> bool:
+    """Check the raw HTML and its parsed tree for math-related content."""
+    # LaTeX backslashes, dollar signs for inline math and math tags
+    if any(marker in html_content for marker in MATH_TEXT_MARKERS):
+        return True
+
+    # Math tags in other letter cases or elements with a math class
+    return bool(MATH_XPATH(tree))
+
+
+def _parse_html(html_content: str) -> tuple[str, bool]:
+    """
+    Parse rendered HTML once and return its visible text and whether it is math-related.
+
+    Math detection runs on the tree before code blocks are stripped, so the result
+    matches is_math_article() on the same HTML.
+    """
+    tree = _parse_tree(html_content)
+    if tree is None:
+        return "", False
+
+    is_math = _has_math_markup(html_content, tree)
+    return _visible_text_from_tree(tree), is_math
+
+
 def get_visible_text(html_content: str) -> str:
     """
     Extract only visible text from HTML, excluding code blocks, pre tags, and script/style content.
 
     This helps avoid false positives from legitimate code examples or technical documentation.
     """
-    if not html_content:
+    tree = _parse_tree(html_content)
+    if tree is None:
         return ""
 
-    soup = BeautifulSoup(html_content, "lxml")
-
-    # Remove script, style, code, pre, and tt tags (they contain legitimate syntax examples)
-    for tag in soup.find_all(["script", "style", "code", "pre", "tt", "syntaxhighlight"]):
-        tag.decompose()
-
-    # Get visible text
-    visible_text = soup.get_text()
-    return visible_text
+    return _visible_text_from_tree(tree)
 
 
 def detect_broken_wikicode_indicators(html_content: str, wiki_lang: str = "en") -> Counter:
@@ -46,78 +148,61 @@ def detect_broken_wikicode_indicators(html_content: str, wiki_lang: str = "en")
         return Counter()
 
     # Extract only visible text (excluding code blocks, pre tags, etc.)
-    visible_text = get_visible_text(html_content)
+    visible_text, is_math = _parse_html(html_content)
+    # ASCII substrings are counted on the raw bytes, which avoids per-character
+    # dispatch on wide (non-Latin-1) strings. UTF-8 never puts ASCII bytes inside
+    # a multi-byte character, so the counts are the same as on the text.
+    visible_bytes = visible_text.encode("utf-8", "ignore")
 
     indicators: Counter[str] = Counter()
 
-    # Template syntax
-    indicators["{{"] = visible_text.count("{{")
-    indicators["}}"] = visible_text.count("}}")
+    # Template and internal link syntax
+    for indicator in LITERAL_INDICATORS:
+        indicators[indicator] = visible_bytes.count(indicator.encode("ascii"))
 
-    # Internal link syntax
-    indicators["[["] = visible_text.count("[[")
-    indicators["]]"] = visible_text.count("]]")
+    # Reference, div and span tags (case insensitive) - only in visible text
+    for indicator, pattern in TAG_INDICATOR_PATTERNS.items():
+        indicators[indicator] = len(pattern.findall(visible_text))
 
-    # Reference tags (case insensitive) - only in visible text
-    indicators["<ref"] = len(re.findall(r"<ref\b", visible_text, re.IGNORECASE))
-    indicators["</ref"] = len(re.findall(r"</ref>", visible_text, re.IGNORECASE))
-    indicators["ref>"] = len(re.findall(r"\bref>", visible_text, re.IGNORECASE))
-
-    # Div tags
-    indicators["<div"] = len(re.findall(r"<div\b", visible_text, re.IGNORECASE))
-    indicators["</div"] = len(re.findall(r"</div>", visible_text, re.IGNORECASE))
-    indicators["div>"] = len(re.findall(r"\bdiv>", visible_text, re.IGNORECASE))
-
-    # Span tags
-    indicators["<span"] = len(re.findall(r"<span\b", visible_text, re.IGNORECASE))
-    indicators["</span"] = len(re.findall(r"</span>", visible_text, re.IGNORECASE))
-    indicators["span>"] = len(re.findall(r"\bspan>", visible_text, re.IGNORECASE))
-
-    # Media/category syntax with localization
-    media_keywords = get_localized_media_keywords(wiki_lang)
-    for keyword in media_keywords:
-        pattern = re.escape(f"[{keyword}:")
-        indicators[f"[{keyword}:"] = len(re.findall(pattern, visible_text, re.IGNORECASE))
+    # Media/category syntax with localization. Localized keywords may contain
+    # non-ASCII letters, so they are matched on the decoded text to keep
+    # case-insensitive matching Unicode aware.
+    media_indicators, media_pattern = _media_keyword_pattern(wiki_lang)
+    for indicator in media_indicators:
+        indicators[indicator] = 0
+    for match in media_pattern.finditer(visible_text):
+        position = next(i for i, group in enumerate(match.groups()) if group is not None)
+        indicators[media_indicators[position]] += 1
 
     # Section headers (==) - check if article might be math-related
     # Only count if not in a math context
-    if not is_math_article(html_content):
-        indicators["=="] = visible_text.count("==")
+    if not is_math:
+        indicators["=="] = visible_bytes.count(b"==")
 
     return indicators
 
 
+@lru_cache(maxsize=64)
+def _media_keyword_pattern(wiki_lang: str) -> tuple[tuple[str, ...], re.Pattern[str]]:
+    """
+    Compile the localized media/category indicators of a language into one pattern.
+
+    Each keyword gets its own capture group, so a single scan of the text counts
+    every indicator: the position of the group that matched is the indicator's.
+    """
+    keywords = get_localized_media_keywords(wiki_lang)
+    alternatives = "|".join(f"({re.escape(keyword)})" for keyword in keywords)
+    pattern = re.compile(rf"\[(?:{alternatives}):", re.IGNORECASE)
+    return tuple(f"[{keyword}:" for keyword in keywords), pattern
+
+
 def get_localized_media_keywords(wiki_lang: str) -> list[str]:
     """
     Get localized keywords for File/Image/Category in different languages.
 
     Returns a list of keywords to check for broken media/category syntax.
     """
-    # Mapping of language codes to their File/Image/Category keywords
-    keywords_map = {
-        "en": ["File", "Image", "Category"],
-        "de": ["Datei", "Bild", "Kategorie"],
-        "fr": ["Fichier", "Image", "Catégorie"],
-        "es": ["Archivo", "Imagen", "Categoría"],
-        "it": ["File", "Immagine", "Categoria"],
-        "pt": ["Ficheiro", "Imagem", "Categoria"],
-        "pl": ["Plik", "Grafika", "Kategoria"],
-        "ru": ["Файл", "Изображение", "Категория"],
-        "ja": ["ファイル", "画像", "カテゴリ"],
-        "zh": ["文件", "图像", "分类"],
-        "hu": ["Fájl", "Kép", "Kategória"],  # Hungarian
-        "nl": ["Bestand", "Afbeelding", "Categorie"],  # Dutch
-        "sv": ["Fil", "Bild", "Kategori"],  # Swedish
-        "fi": ["Tiedosto", "Kuva", "Luokka"],  # Finnish
-        "no": ["Fil", "Bilde", "Kategori"],  # Norwegian
-        "da": ["Fil", "Billede", "Kategori"],  # Danish
-        "cs": ["Soubor", "Obrázek", "Kategorie"],  # Czech
-        "tr": ["Dosya", "Resim", "Kategori"],  # Turkish
-        "ar": ["ملف", "صورة", "تصنيف"],  # Arabic
-        "ko": ["파일", "그림", "분류"],  # Korean
-    }
-
-    return keywords_map.get(wiki_lang, keywords_map["en"])
+    return list(MEDIA_KEYWORDS.get(wiki_lang, MEDIA_KEYWORDS["en"]))
 
 
 def is_math_article(html_content: str) -> bool:
@@ -130,19 +215,15 @@ def is_math_article(html_content: str) -> bool:
     if not html_content:
         return False
 
-    # Check for math-related patterns
-    math_indicators = [
-        r'class="[^"]*math[^"]*"',  # Math class in HTML
-        r"<math",  # Math tags
-        r"\\",  # LaTeX backslash
-        r"\$",  # Dollar sign for inline math
-    ]
+    # Cheap substring checks first; only parse when they are inconclusive.
+    if any(marker in html_content for marker in MATH_TEXT_MARKERS):
+        return True
 
-    for pattern in math_indicators:
-        if re.search(pattern, html_content, re.IGNORECASE):
-            return True
+    tree = _parse_tree(html_content)
+    if tree is None:
+        return False
 
-    return False
+    return bool(MATH_XPATH(tree))
 
 
 def check_broken_wikicode(
@@ -165,6 +246,10 @@ def check_broken_wikicode(
     Returns:
         Tuple of (has_broken_wikicode: bool, details: str)
     """
+    # Blanked or empty pages cannot introduce broken wikicode; skip parsing them.
+    if not current_html or len(current_html) < MIN_HTML_LENGTH:
+        return False, ""
+
     current_indicators = detect_broken_wikicode_indicators(current_html, wiki_lang)
 
     # If we have a parent, compare to find NEW indicators
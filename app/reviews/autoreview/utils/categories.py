@@ -16,6 +16,5 @@ def blocking_category_hits(revision: PendingRevision, blocking_lookup: dict[str,
     if isinstance(page_categories, list):
         categories.extend(str(category) for category in page_categories if category)
 
-    return {
-        blocking_lookup[cat.casefold()] for cat in categories if cat.casefold() in blocking_lookup
-    }
+    folded_categories = {category.casefold() for category in categories}
+    return {blocking_lookup[key] for key in folded_categories & blocking_lookup.keys()}
@@ -5,6 +5,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.core.cache import cache
 from pywikibot.comms import http
 
 from .living_person import is_living_person_article
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Seconds before ORES is asked again about a revision whose lookup failed.
+ORES_FAILURE_RETRY_DELAY = 60
+
 
 def get_ores_thresholds(revision: PendingRevision) -> tuple[float, float]:
     """Get ORES thresholds with living person adjustments."""
@@ -27,18 +31,25 @@ def get_ores_thresholds(revision: PendingRevision) -> tuple[float, float]:
     if configuration.ores_goodfaith_threshold is not None:
         goodfaith_threshold = configuration.ores_goodfaith_threshold
 
-    if is_living_person_article(revision):
-        living_damaging = (
-            configuration.ores_damaging_threshold_living or settings.ORES_DAMAGING_THRESHOLD_LIVING
-        )
-        living_goodfaith = (
-            configuration.ores_goodfaith_threshold_living
-            or settings.ORES_GOODFAITH_THRESHOLD_LIVING
-        )
-        damaging_threshold = living_damaging
-        goodfaith_threshold = living_goodfaith
+    living_damaging = (
+        configuration.ores_damaging_threshold_living or settings.ORES_DAMAGING_THRESHOLD_LIVING
+    )
+    living_goodfaith = (
+        configuration.ores_goodfaith_threshold_living or settings.ORES_GOODFAITH_THRESHOLD_LIVING
+    )
+    thresholds = (damaging_threshold, goodfaith_threshold)
+    living_thresholds = (living_damaging, living_goodfaith)
+    # The living person lookup queries Wikidata; skip it when it cannot change the result.
+    if living_thresholds != thresholds and is_living_person_article(revision):
+        return living_thresholds
 
-    return damaging_threshold, goodfaith_threshold
+    return thresholds
+
+
+def _ores_failure_key(revision: PendingRevision) -> str:
+    """Cache key marking a recently failed ORES lookup for the revision."""
+    wiki = revision.page.wiki
+    return f"ores-failure:{wiki.code}:{wiki.family}:{revision.revid}"
 
 
 def fetch_ores_scores(
@@ -86,17 +97,25 @@ def fetch_ores_scores(
 
     except Exception as e:
         logger.error(f"Error fetching ORES scores for revision {revision.revid}: {e}")
+        cache.set(_ores_failure_key(revision), True, ORES_FAILURE_RETRY_DELAY)
         return None, None
 
 
 def get_ores_scores(
     revision: PendingRevision, check_damaging: bool, check_goodfaith: bool
 ) -> tuple[float | None, float | None]:
-    """Get ORES scores, using cache if available."""
+    """
+    Get ORES scores, using cache if available.
+
+    A revision whose lookup failed within the last ORES_FAILURE_RETRY_DELAY seconds
+    gets (None, None) without a new request.
+    """
     from reviews.models import ModelScores
 
     try:
         model_scores = ModelScores.objects.get(revision=revision)
         return model_scores.ores_damaging_score, model_scores.ores_goodfaith_score
     except ModelScores.DoesNotExist:
+        if cache.get(_ores_failure_key(revision)):
+            return None, None
         return fetch_ores_scores(revision, check_damaging, check_goodfaith)
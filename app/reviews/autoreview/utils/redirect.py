@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 import pywikibot
@@ -48,18 +49,26 @@ def get_redirect_aliases(wiki: Wiki) -> list[str]:
     return language_fallbacks.get(wiki.code, ["#REDIRECT"])
 
 
-def is_redirect(wikitext: str, redirect_aliases: list[str]) -> bool:
-    """Check if wikitext represents a redirect page."""
-    if not wikitext or not redirect_aliases:
-        return False
-
+@lru_cache(maxsize=64)
+def _redirect_pattern(redirect_aliases: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile the redirect aliases of a wiki into one pattern, or None if none are usable."""
     patterns = [
         re.escape(alias.lstrip("#").strip())
         for alias in redirect_aliases
         if alias.lstrip("#").strip()
     ]
     if not patterns:
+        return None
+
+    return re.compile(
+        r"^#[ \t]*(" + "|".join(patterns) + r")[ \t]*\[\[([^\]\n\r]+?)\]\]", re.IGNORECASE
+    )
+
+
+def is_redirect(wikitext: str, redirect_aliases: list[str]) -> bool:
+    """Check if wikitext represents a redirect page."""
+    if not wikitext or not redirect_aliases:
         return False
 
-    redirect_pattern = r"^#[ \t]*(" + "|".join(patterns) + r")[ \t]*\[\[([^\]\n\r]+?)\]\]"
-    return bool(re.match(redirect_pattern, wikitext, re.IGNORECASE))
+    redirect_pattern = _redirect_pattern(tuple(redirect_aliases))
+    return redirect_pattern is not None and redirect_pattern.match(wikitext) is not None
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from bs4 import BeautifulSoup
-
 if TYPE_CHECKING:
     from reviews.models import PendingRevision
     from reviews.services import WikiClient
@@ -14,6 +12,10 @@ def get_render_error_count(revision: PendingRevision, html: str) -> int:
     if revision.render_error_count is not None:
         return revision.render_error_count
 
+    # Imported here: BeautifulSoup is only needed once per uncached revision and is
+    # slow to import, so process and test startup should not pay for it.
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html, "lxml")
     error_count = len(soup.find_all(class_="error"))
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .wikitext import extract_additions, get_parent_wikitext, normalize_wikitext
@@ -12,6 +13,12 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _normalized_stable_text(latest_wikitext: str) -> str:
+    """Normalize the stable text once for all pending revisions of a page."""
+    return normalize_wikitext(latest_wikitext)
+
+
 def is_addition_superseded(
     revision: PendingRevision,
     current_stable_wikitext: str,
@@ -67,17 +74,20 @@ def is_addition_superseded(
             "message": "No additions detected in pending revision.",
         }
 
-    normalized_latest = normalize_wikitext(latest_wikitext)
+    normalized_latest = _normalized_stable_text(latest_wikitext)
     if not normalized_latest:
         return {
             "is_superseded": False,
             "message": "Unable to normalize latest stable wikitext.",
         }
 
+    # Only seq2 is indexed, so one matcher serves every addition of this call.
+    matcher = SequenceMatcher(None, "", normalized_latest)
+
     for addition in additions:
         normalized_addition = normalize_wikitext(addition)
 
-        matcher = SequenceMatcher(None, normalized_addition, normalized_latest)
+        matcher.set_seq1(normalized_addition)
         significant_match_length = sum(
             block.size for block in matcher.get_matching_blocks()[:-1] if block.size >= 4
         )
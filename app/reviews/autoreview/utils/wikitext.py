@@ -11,6 +11,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Markup removed by normalize_wikitext, in the order it is applied.
+REF_PATTERN = re.compile(r"<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+SELF_CLOSING_REF_PATTERN = re.compile(r"<ref[^>]*/>", re.IGNORECASE)
+# Matches innermost templates only; applied twice to also drop singly nested ones.
+TEMPLATE_PATTERN = re.compile(r"\{\{[^{}]*\}\}")
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+CATEGORY_LINK_PATTERN = re.compile(r"\[\[Category:[^\]]+\]\]", re.IGNORECASE)
+MEDIA_LINK_PATTERN = re.compile(r"\[\[(File|Image):[^\]]+\]\]", re.IGNORECASE | re.DOTALL)
+PIPED_LINK_PATTERN = re.compile(r"\[\[[^\]|]+\|([^\]]+)\]\]")
+LINK_PATTERN = re.compile(r"\[\[([^\]]+)\]\]")
+EMPHASIS_PATTERN = re.compile(r"'{2,}")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 def normalize_wikitext(text: str) -> str:
     """Normalize wikitext for similarity comparison."""
     if not text:
@@ -18,17 +32,42 @@ def normalize_wikitext(text: str) -> str:
 
     # TODO: check why text is not always suitable for re.
     text = str(text)
-    text = re.sub(r"<ref[^>]*>.*?</ref>", "", text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r"<ref[^>]*/>", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\{\{[^{}]*\}\}", "", text)
-    text = re.sub(r"\{\{[^{}]*\}\}", "", text)
-    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
-    text = re.sub(r"\[\[Category:[^\]]+\]\]", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\[\[(File|Image):[^\]]+\]\]", "", text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r"\[\[[^\]|]+\|([^\]]+)\]\]", r"\1", text)
-    text = re.sub(r"\[\[([^\]]+)\]\]", r"\1", text)
-    text = re.sub(r"'{2,}", "", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = REF_PATTERN.sub("", text)
+    text = SELF_CLOSING_REF_PATTERN.sub("", text)
+    text = TEMPLATE_PATTERN.sub("", text)
+    text = TEMPLATE_PATTERN.sub("", text)
+    text = COMMENT_PATTERN.sub("", text)
+    text = CATEGORY_LINK_PATTERN.sub("", text)
+    text = MEDIA_LINK_PATTERN.sub("", text)
+    text = PIPED_LINK_PATTERN.sub(r"\1", text)
+    text = LINK_PATTERN.sub(r"\1", text)
+    text = EMPHASIS_PATTERN.sub("", text)
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Return the length of the longest common prefix of two strings."""
+    # Binary search over slice comparisons, which run in C, instead of a per-character loop.
+    low, high = 0, min(len(first), len(second))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(first: str, second: str, limit: int) -> int:
+    """Return the length, at most limit, of the longest common suffix of two strings."""
+    low, high = 0, limit
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[len(first) - middle :] == second[len(second) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
 
 
 def extract_additions(parent_wikitext: str, pending_wikitext: str) -> list[str]:
@@ -39,12 +78,24 @@ def extract_additions(parent_wikitext: str, pending_wikitext: str) -> list[str]:
     if not parent_wikitext:
         return [pending_wikitext]
 
-    matcher = SequenceMatcher(None, parent_wikitext, pending_wikitext)
+    # Pending changes are usually small edits to long pages. Only the region between the
+    # unchanged head and tail is diffed, which keeps SequenceMatcher's quadratic matching
+    # and its autojunk heuristic for long inputs away from the rest of the page.
+    prefix = _common_prefix_length(parent_wikitext, pending_wikitext)
+    suffix = _common_suffix_length(
+        parent_wikitext,
+        pending_wikitext,
+        min(len(parent_wikitext), len(pending_wikitext)) - prefix,
+    )
+    parent_changed = parent_wikitext[prefix : len(parent_wikitext) - suffix]
+    pending_changed = pending_wikitext[prefix : len(pending_wikitext) - suffix]
+
+    matcher = SequenceMatcher(None, parent_changed, pending_changed)
     additions = []
 
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         if tag in ("insert", "replace"):
-            added_text = pending_wikitext[j1:j2]
+            added_text = pending_changed[j1:j2]
             if added_text.strip():
                 additions.append(added_text)
 
@@ -65,7 +116,7 @@ def get_parent_wikitext(revision: PendingRevision) -> str:
         from reviews.models import PendingRevision as PR
 
         parent_revision = PR.objects.get(page=revision.page, revid=parentid)
-        return parent_revision.get_wikitext()
+        parent_wikitext = parent_revision.get_wikitext()
     except Exception:
         logger.warning(
             "Parent revision %s not found in local database for revision %s",
@@ -73,3 +124,7 @@ def get_parent_wikitext(revision: PendingRevision) -> str:
             revision.revid,
         )
         return ""
+
+    # Several checks compare against the parent during one autoreview run.
+    revision.parent_wikitext = parent_wikitext
+    return parent_wikitext
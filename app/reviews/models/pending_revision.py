@@ -34,6 +34,9 @@ class PendingRevision(models.Model):
     categories = models.JSONField(default=list, blank=True)
     superset_data = models.JSONField(default=dict, blank=True)
 
+    # Parent revision wikitext loaded during an autoreview run; not stored.
+    parent_wikitext: str | None = None
+
     class Meta:
         unique_together = ("page", "revid")
         ordering = ["timestamp"]
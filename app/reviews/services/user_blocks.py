@@ -1,38 +1,74 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 
 import pywikibot
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent block log requests made by prefetch_user_blocks().
+BLOCK_LOG_MAX_CONNECTIONS = 4
+
 
 @lru_cache(maxsize=1000)
+def _fetch_user_blocked_after(code: str, family: str, username: str, year: int) -> bool:
+    """Query the block log; API errors propagate so that they are never cached."""
+    site = pywikibot.Site(code, family)
+    timestamp = pywikibot.Timestamp(year, 1, 1, 0, 0, 0)
+
+    block_events = site.logevents(
+        logtype="block",
+        page=f"User:{username}",
+        start=timestamp,
+        reverse=True,
+        total=1,
+    )
+
+    for event in block_events:
+        if event.action() == "block":
+            return True
+
+    return False
+
+
 def was_user_blocked_after(code: str, family: str, username: str, year: int) -> bool:
     """
     Check if user was blocked after a specific year.
 
-    Timestamp precision is reduced to year to improve cache hit rate.
+    Timestamp precision is reduced to year to improve cache hit rate. Failed lookups
+    are logged and reported as not blocked, but retried on the next call.
     """
     try:
-        site = pywikibot.Site(code, family)
-        timestamp = pywikibot.Timestamp(year, 1, 1, 0, 0, 0)
+        return _fetch_user_blocked_after(code, family, username, year)
+    except Exception as e:
+        logger.error(f"Error checking blocks for {username}: {e}")
+        return False
 
-        block_events = site.logevents(
-            logtype="block",
-            page=f"User:{username}",
-            start=timestamp,
-            reverse=True,
-            total=1,
-        )
 
-        for event in block_events:
-            if event.action() == "block":
-                return True
+# Successful lookups are cached by _fetch_user_blocked_after(); expose its reset here.
+was_user_blocked_after.cache_clear = _fetch_user_blocked_after.cache_clear  # type: ignore[attr-defined]
 
-        return False
 
-    except Exception as e:
-        logger.error(f"Error checking blocks for {username}: {e}")
-        return False
+def prefetch_user_blocks(code: str, family: str, lookups: Iterable[tuple[str, int]]) -> None:
+    """
+    Look up the block status of several (username, year) pairs concurrently.
+
+    The block log API takes one user per request, so the lookups are made in parallel,
+    with at most BLOCK_LOG_MAX_CONNECTIONS requests in flight. The answers land in the
+    was_user_blocked_after() cache; failed lookups are retried when that is called.
+    """
+    pending = set(lookups)
+    if len(pending) < 2:
+        return
+
+    def lookup(username_and_year: tuple[str, int]) -> bool:
+        username, year = username_and_year
+        return was_user_blocked_after(code, family, username, year)
+
+    # Sites are created and cached by pywikibot; do that here rather than racing in the workers.
+    pywikibot.Site(code, family)
+    with ThreadPoolExecutor(max_workers=min(BLOCK_LOG_MAX_CONNECTIONS, len(pending))) as executor:
+        list(executor.map(lookup, pending))
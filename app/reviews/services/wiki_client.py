@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Iterable
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -18,7 +19,7 @@ from .parsers import (
     prepare_superset_metadata,
 )
 from .types import RevisionPayload
-from .user_blocks import was_user_blocked_after
+from .user_blocks import prefetch_user_blocks, was_user_blocked_after
 
 if TYPE_CHECKING:
     from reviews.models import (
@@ -93,6 +94,14 @@ class WikiClient:
         year = edit_timestamp.year
         return was_user_blocked_after(self.wiki.code, self.wiki.family, username, year)
 
+    def prefetch_user_blocks(self, edits: Iterable[tuple[str, datetime]]) -> None:
+        """Look up in parallel whether users were blocked after several edits."""
+        prefetch_user_blocks(
+            self.wiki.code,
+            self.wiki.family,
+            ((username, edit_timestamp.year) for username, edit_timestamp in edits),
+        )
+
     def get_rendered_html(self, revid: int) -> str:
         """Fetch the rendered HTML for a specific revision."""
         from reviews.models import PendingRevision
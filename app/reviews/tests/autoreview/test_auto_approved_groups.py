@@ -2,25 +2,25 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.autoreview.checks.auto_approved_groups import check_auto_approved_groups
 from reviews.autoreview.context import CheckContext
+from reviews.models import EditorProfile, PendingRevision
 
 
-class AutoApprovedGroupsTests(TestCase):
+class AutoApprovedGroupsTests(SimpleTestCase):
     def test_user_in_auto_approved_group(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["sysop", "user"]}
-        mock_revision.user_name = "AdminUser"
+        revision = PendingRevision(
+            superset_data={"user_groups": ["sysop", "user"]}, user_name="AdminUser"
+        )
 
-        mock_profile = MagicMock()
-        mock_profile.usergroups = ["sysop", "user"]
+        profile = EditorProfile(usergroups=["sysop", "user"])
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
-            profile=mock_profile,
+            profile=profile,
             auto_groups={"sysop": "sysop", "bureaucrat": "bureaucrat"},
             blocking_categories={},
             redirect_aliases=[],
@@ -33,18 +33,14 @@ class AutoApprovedGroupsTests(TestCase):
         self.assertIn("sysop", result.message)
 
     def test_user_not_in_auto_approved_group(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["user"]}
-        mock_revision.user_name = "RegularUser"
+        revision = PendingRevision(superset_data={"user_groups": ["user"]}, user_name="RegularUser")
 
-        mock_profile = MagicMock()
-        mock_profile.usergroups = ["user"]
-        mock_profile.is_autoreviewed = False
+        profile = EditorProfile(usergroups=["user"], is_autoreviewed=False)
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
-            profile=mock_profile,
+            profile=profile,
             auto_groups={"sysop": "sysop", "bureaucrat": "bureaucrat"},
             blocking_categories={},
             redirect_aliases=[],
@@ -55,19 +51,18 @@ class AutoApprovedGroupsTests(TestCase):
         self.assertIn("does not belong", result.message)
 
     def test_user_with_default_autoreview_rights(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["user", "autoreviewer"]}
-        mock_revision.user_name = "AutoreviewUser"
+        revision = PendingRevision(
+            superset_data={"user_groups": ["user", "autoreviewer"]}, user_name="AutoreviewUser"
+        )
 
-        mock_profile = MagicMock()
-        mock_profile.usergroups = ["user", "autoreviewer"]
-        mock_profile.is_autoreviewed = True
-        mock_profile.is_autopatrolled = False
+        profile = EditorProfile(
+            usergroups=["user", "autoreviewer"], is_autoreviewed=True, is_autopatrolled=False
+        )
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
-            profile=mock_profile,
+            profile=profile,
             auto_groups={},
             blocking_categories={},
             redirect_aliases=[],
@@ -80,19 +75,14 @@ class AutoApprovedGroupsTests(TestCase):
         self.assertIn("Autoreviewed", result.message)
 
     def test_user_without_autoreview_rights(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["user"]}
-        mock_revision.user_name = "NewUser"
+        revision = PendingRevision(superset_data={"user_groups": ["user"]}, user_name="NewUser")
 
-        mock_profile = MagicMock()
-        mock_profile.usergroups = ["user"]
-        mock_profile.is_autoreviewed = False
-        mock_profile.is_autopatrolled = False
+        profile = EditorProfile(usergroups=["user"], is_autoreviewed=False, is_autopatrolled=False)
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
-            profile=mock_profile,
+            profile=profile,
             auto_groups={},
             blocking_categories={},
             redirect_aliases=[],
@@ -103,19 +93,18 @@ class AutoApprovedGroupsTests(TestCase):
         self.assertIn("does not have default auto-approval rights", result.message)
 
     def test_user_with_autopatrolled_but_not_autoreviewed(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["user", "autopatrolled"]}
-        mock_revision.user_name = "AutopatrolledUser"
+        revision = PendingRevision(
+            superset_data={"user_groups": ["user", "autopatrolled"]}, user_name="AutopatrolledUser"
+        )
 
-        mock_profile = MagicMock()
-        mock_profile.usergroups = ["user", "autopatrolled"]
-        mock_profile.is_autoreviewed = False
-        mock_profile.is_autopatrolled = True
+        profile = EditorProfile(
+            usergroups=["user", "autopatrolled"], is_autoreviewed=False, is_autopatrolled=True
+        )
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
-            profile=mock_profile,
+            profile=profile,
             auto_groups={},
             blocking_categories={},
             redirect_aliases=[],
@@ -126,12 +115,10 @@ class AutoApprovedGroupsTests(TestCase):
         self.assertIn("does not have autoreview rights", result.message)
 
     def test_no_profile_no_auto_groups(self):
-        mock_revision = MagicMock()
-        mock_revision.superset_data = {"user_groups": ["user"]}
-        mock_revision.user_name = "UnknownUser"
+        revision = PendingRevision(superset_data={"user_groups": ["user"]}, user_name="UnknownUser")
 
         context = CheckContext(
-            revision=mock_revision,
+            revision=revision,
             client=MagicMock(),
             profile=None,
             auto_groups={},
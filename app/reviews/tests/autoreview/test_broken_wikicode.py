@@ -0,0 +1,179 @@
+"""Tests for broken wikicode detection."""
+
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from reviews.autoreview.utils.broken_wikicode import (
+    _parse_html,
+    check_broken_wikicode,
+    detect_broken_wikicode_indicators,
+    get_localized_media_keywords,
+    get_visible_text,
+    is_math_article,
+)
+
+
+class VisibleTextTests(SimpleTestCase):
+    """Test extraction of visible text from rendered HTML."""
+
+    def test_get_visible_text_strips_code_blocks(self):
+        html = "<p>Visible {{text}}</p><pre>{{hidden}}</pre><code>[[hidden]]</code>"
+        text = get_visible_text(html)
+        self.assertIn("Visible {{text}}", text)
+        self.assertNotIn("hidden", text)
+
+    def test_get_visible_text_keeps_text_after_removed_block(self):
+        text = get_visible_text("<div><pre>{{hidden}}</pre> after [[link]]</div>")
+        self.assertEqual(text, " after [[link]]")
+
+    def test_get_visible_text_single_code_element(self):
+        self.assertEqual(get_visible_text("<pre>{{hidden}}</pre>"), "")
+
+    def test_get_visible_text_whitespace_input(self):
+        self.assertEqual(get_visible_text("   "), "")
+
+    def test_get_visible_text_empty_input(self):
+        self.assertEqual(get_visible_text(""), "")
+
+
+class BrokenWikicodeDetectionTests(SimpleTestCase):
+    """Test counting of broken wikicode indicators."""
+
+    # (description, html, wiki language, expected indicator counts)
+    INDICATOR_CASES = [
+        (
+            "template and link syntax",
+            "<p>Some text {{Template}} and [[Link]] and {{Another</p>",
+            "en",
+            {"{{": 2, "}}": 1, "[[": 1, "]]": 1},
+        ),
+        (
+            "tag syntax is case insensitive",
+            "<p>&lt;REF name=x&gt;cite&lt;/ref&gt; &lt;Div class=a&gt;</p>",
+            "en",
+            {"<ref": 1, "</ref": 1, "<div": 1},
+        ),
+        (
+            "non-ASCII text is counted",
+            "<p>Ääkköset {{malline}} – ✓ [[linkki]]</p>",
+            "en",
+            {"{{": 1, "[[": 1},
+        ),
+        (
+            "tag names next to non-ASCII letters are not tags",
+            "<p>äref&gt; &lt;refä &lt;div&gt;ädiv&gt;</p>",
+            "en",
+            {"<ref": 0, "ref>": 0, "<div": 1, "div>": 1},
+        ),
+        (
+            "localized media keywords",
+            "<p>[Tiedosto:Kuva.jpg] ja [luokka:Testi]</p>",
+            "fi",
+            {"[Tiedosto:": 1, "[Luokka:": 1},
+        ),
+        (
+            "media keywords counted separately",
+            "<p>[File:a.jpg] [image:b.png] [FILE:c.svg] [Category:X]</p>",
+            "en",
+            {"[File:": 2, "[Image:": 1, "[Category:": 1},
+        ),
+        (
+            "non-ASCII media keywords are case insensitive",
+            "<p>[файл:Test.jpg]</p>",
+            "ru",
+            {"[Файл:": 1},
+        ),
+    ]
+
+    def test_indicator_counts(self):
+        for description, html, wiki_lang, expected in self.INDICATOR_CASES:
+            with self.subTest(description):
+                indicators = detect_broken_wikicode_indicators(html, wiki_lang=wiki_lang)
+                for indicator, count in expected.items():
+                    self.assertEqual(indicators[indicator], count, indicator)
+
+    def test_unmatched_media_keywords_are_zero(self):
+        indicators = detect_broken_wikicode_indicators("<p>Plain text</p>", wiki_lang="de")
+        self.assertEqual(indicators["[Datei:"], 0)
+        self.assertIn("[Kategorie:", indicators)
+
+    def test_unknown_language_uses_english_media_keywords(self):
+        keywords = get_localized_media_keywords("xx")
+        self.assertEqual(keywords, ["File", "Image", "Category"])
+        keywords.append("Media")
+        self.assertEqual(get_localized_media_keywords("en"), ["File", "Image", "Category"])
+
+    def test_single_parse_matches_separate_helpers(self):
+        html = "<p>{{a [[b == c</p><pre>{{code}}</pre>"
+        self.assertEqual(_parse_html(html), (get_visible_text(html), is_math_article(html)))
+
+    def test_section_headers_skipped_for_math_articles(self):
+        self.assertEqual(detect_broken_wikicode_indicators("<p>== Header ==</p>")["=="], 2)
+        indicators = detect_broken_wikicode_indicators(
+            '<p>a == b <span class="mwe-math">x</span></p>'
+        )
+        self.assertNotIn("==", indicators)
+
+
+class IsMathArticleTests(SimpleTestCase):
+    """Test detection of math-related content."""
+
+    def test_math_tag(self):
+        self.assertTrue(is_math_article("<p><math>x^2</math></p>"))
+
+    def test_math_class(self):
+        self.assertTrue(is_math_article('<span class="mwe-math-element">x</span>'))
+
+    def test_uppercase_math_tag(self):
+        self.assertTrue(is_math_article("<p><MATH>x^2</MATH></p>"))
+
+    def test_nested_math_class(self):
+        self.assertTrue(
+            is_math_article('<div><p><span class="texhtml MWE-MATH">x</span></p></div>')
+        )
+
+    def test_latex_backslash(self):
+        self.assertTrue(is_math_article(r"<p>\frac{1}{2}</p>"))
+
+    def test_dollar_sign(self):
+        self.assertTrue(is_math_article("<p>$x$</p>"))
+
+    def test_plain_article(self):
+        self.assertFalse(is_math_article("<p>Plain text</p>"))
+
+
+def parser_output(body: str) -> str:
+    """Wrap HTML the way MediaWiki's parse API returns it."""
+    return f'<div class="mw-content-ltr mw-parser-output" lang="en" dir="ltr">{body}</div>'
+
+
+class CheckBrokenWikicodeTests(SimpleTestCase):
+    """Test comparison of indicators between a revision and its parent."""
+
+    def test_empty_current_html(self):
+        self.assertEqual(check_broken_wikicode("", None), (False, ""))
+
+    def test_short_html_skipped(self):
+        self.assertEqual(check_broken_wikicode("<p>{{a [[b {{c</p>", None), (False, ""))
+
+    def test_no_broken_wikicode_in_clean_html(self):
+        html = parser_output("<p>Clean content</p>")
+        self.assertEqual(check_broken_wikicode(html, None), (False, ""))
+
+    def test_new_broken_wikicode_detected(self):
+        self.assertEqual(
+            check_broken_wikicode(
+                parser_output("<p>Broken {{Template and [[Link</p>"),
+                parser_output("<p>Clean content</p>"),
+            ),
+            (True, "Introduced broken wikicode: {{: 1, [[: 1"),
+        )
+
+    def test_compares_with_parent_html(self):
+        html = parser_output("<p>Existing {{a {{b [[c</p>")
+        self.assertEqual(check_broken_wikicode(html, html), (False, ""))
+
+    def test_single_low_count_indicator_ignored(self):
+        html = parser_output("<p>One {{ only</p>")
+        self.assertEqual(check_broken_wikicode(html, None), (False, ""))
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.autoreview.utils.isbn import find_invalid_isbns, validate_isbn_10, validate_isbn_13
 
 
-class ISBNValidationTests(TestCase):
+class ISBNValidationTests(SimpleTestCase):
     """Test ISBN-10 and ISBN-13 checksum validation."""
 
     def test_valid_isbn_10_with_numeric_check_digit(self):
@@ -64,7 +64,7 @@ class ISBNValidationTests(TestCase):
         self.assertFalse(validate_isbn_13("978030640615X"))
 
 
-class ISBNDetectionTests(TestCase):
+class ISBNDetectionTests(SimpleTestCase):
     """Test ISBN detection in wikitext."""
 
     def test_no_isbns_in_text(self):
@@ -147,6 +147,11 @@ class ISBNDetectionTests(TestCase):
         invalid = find_invalid_isbns(text)
         self.assertEqual(len(invalid), 2)
 
+    def test_repeated_invalid_isbn_flagged_each_time(self):
+        """Each occurrence of a repeated invalid ISBN should be flagged as written."""
+        text = "ISBN 0-306-40615-3. Again: ISBN 0306406153. Valid: ISBN 0-306-40615-2"
+        self.assertEqual(find_invalid_isbns(text), ["0-306-40615-3", "0306406153"])
+
     def test_case_insensitive_isbn_detection(self):
         """ISBN detection should be case-insensitive."""
         text1 = "ISBN: 0-306-40615-2"
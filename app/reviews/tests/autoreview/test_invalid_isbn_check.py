@@ -3,38 +3,33 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.autoreview.checks.invalid_isbn import check_invalid_isbn
 from reviews.autoreview.context import CheckContext
-from reviews.models import PendingPage, PendingRevision, Wiki, WikiConfiguration
+from reviews.models import PendingPage, PendingRevision, Wiki
 
 
-class InvalidISBNCheckTests(TestCase):
-    def test_check_with_invalid_isbn(self):
-        wiki = Wiki.objects.create(
-            name="Test Wiki",
-            code="test",
-            family="wikipedia",
-            api_endpoint="https://test.wikipedia.org/w/api.php",
-        )
-        WikiConfiguration.objects.create(wiki=wiki)
+class InvalidISBNCheckTests(SimpleTestCase):
+    # The check only reads the revision wikitext, so unsaved instances are enough.
+    wiki = Wiki(
+        name="Test Wiki",
+        code="test",
+        family="wikipedia",
+        api_endpoint="https://test.wikipedia.org/w/api.php",
+    )
+    page = PendingPage(wiki=wiki, pageid=1, title="Test Page", stable_revid=100)
 
-        page = PendingPage.objects.create(
-            wiki=wiki,
-            pageid=1,
-            title="Test Page",
-            stable_revid=100,
-        )
-
-        revision = PendingRevision.objects.create(
-            page=page,
+    def test_check_with_invalid_isbn(self):
+        now = datetime.now(timezone.utc)
+        revision = PendingRevision(
+            page=self.page,
             revid=101,
             parentid=100,
             user_name="Editor",
             user_id=1,
-            timestamp=datetime.now(timezone.utc),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now,
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="test",
             comment="Added book with invalid ISBN",
@@ -59,29 +54,15 @@ class InvalidISBNCheckTests(TestCase):
         self.assertIn("invalid ISBN", result.message)
 
     def test_check_with_valid_isbn(self):
-        wiki = Wiki.objects.create(
-            name="Test Wiki",
-            code="test",
-            family="wikipedia",
-            api_endpoint="https://test.wikipedia.org/w/api.php",
-        )
-        WikiConfiguration.objects.create(wiki=wiki)
-
-        page = PendingPage.objects.create(
-            wiki=wiki,
-            pageid=2,
-            title="Test Page 2",
-            stable_revid=200,
-        )
-
-        revision = PendingRevision.objects.create(
-            page=page,
-            revid=201,
-            parentid=200,
+        now = datetime.now(timezone.utc)
+        revision = PendingRevision(
+            page=self.page,
+            revid=102,
+            parentid=100,
             user_name="Editor",
             user_id=2,
-            timestamp=datetime.now(timezone.utc),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now,
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="test",
             comment="Added book with valid ISBN",
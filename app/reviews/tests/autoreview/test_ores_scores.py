@@ -6,15 +6,63 @@ import json
 from datetime import timedelta
 from unittest.mock import MagicMock, Mock, patch
 
+from django.core.cache import cache
 from django.test import TestCase
 
 from reviews.autoreview.checks.ores_scores import check_ores_scores
 from reviews.autoreview.context import CheckContext
+from reviews.autoreview.utils.ores import get_ores_scores, get_ores_thresholds
+
+
+def fiwiki_revision_mock() -> MagicMock:
+    """Build a mock of revision 12345 on the Finnish Wikipedia."""
+    revision = MagicMock(revid=12345)
+    revision.page.wiki.configure_mock(code="fi", family="wikipedia")
+    return revision
 
 
 class OresScoreTests(TestCase):
     """Test ORES damaging and goodfaith score checks."""
 
+    mock_fetch: MagicMock
+    mock_model_scores_get: MagicMock
+    mock_model_scores_create: MagicMock
+    mock_is_living_person: MagicMock
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.mock_fetch = cls.start_class_patch("reviews.autoreview.utils.ores.http.fetch")
+        cls.mock_model_scores_get = cls.start_class_patch("reviews.models.ModelScores.objects.get")
+        cls.mock_model_scores_create = cls.start_class_patch(
+            "reviews.models.ModelScores.objects.create"
+        )
+        cls.mock_is_living_person = cls.start_class_patch(
+            "reviews.autoreview.utils.living_person.is_living_person"
+        )
+
+    @classmethod
+    def start_class_patch(cls, target: str) -> MagicMock:
+        """Patch the target until the class's tests have run and return the mock."""
+        patcher = patch(target, new_callable=MagicMock)
+        cls.addClassCleanup(patcher.stop)
+        return patcher.start()
+
+    def setUp(self):
+        from reviews.models import ModelScores
+
+        for mock in (
+            self.mock_fetch,
+            self.mock_model_scores_get,
+            self.mock_model_scores_create,
+            self.mock_is_living_person,
+        ):
+            mock.reset_mock(return_value=True, side_effect=True)
+        self.mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
+        self.mock_is_living_person.return_value = False
+        # Recently failed lookups are remembered in the cache.
+        cache.clear()
+
     def _create_context(self, revision, damaging_threshold=0.7, goodfaith_threshold=0.5):
         wiki = revision.page.wiki
 
@@ -47,161 +95,67 @@ class OresScoreTests(TestCase):
             redirect_aliases=[],
         )
 
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    @patch("reviews.models.ModelScores.objects.create")
-    @patch("reviews.models.ModelScores.objects.get")
-    @patch("reviews.autoreview.utils.ores.http.fetch")
-    def test_ores_damaging_score_exceeds_threshold(
-        self, mock_fetch, mock_model_scores_get, mock_model_scores_create, mock_is_living_person
-    ):
-        """Test that high damaging score blocks auto-approval."""
-        from reviews.models import ModelScores
-
-        mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
-        mock_model_scores_create.return_value = MagicMock()
-
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_response.text = json.dumps(
-            {
-                "fiwiki": {
-                    "scores": {
-                        "12345": {
-                            "damaging": {
-                                "score": {
-                                    "prediction": True,
-                                    "probability": {"true": 0.85, "false": 0.15},
+    def test_ores_score_thresholds(self):
+        """Test that scores beyond either threshold block auto-approval."""
+        cases = [
+            # (name, model probabilities, damaging threshold, goodfaith threshold,
+            #  expected status, expected message fragment or None if not blocked)
+            ("damaging exceeds threshold", {"damaging": 0.85}, 0.7, 0.0, "fail", "0.850"),
+            ("goodfaith below threshold", {"goodfaith": 0.25}, 0.0, 0.5, "fail", "0.250"),
+            (
+                "within thresholds",
+                {"damaging": 0.15, "goodfaith": 0.85},
+                0.7,
+                0.5,
+                "ok",
+                None,
+            ),
+        ]
+
+        for name, probabilities, damaging, goodfaith, status, fragment in cases:
+            with self.subTest(name):
+                mock_response = Mock()
+                mock_response.headers = {}
+                mock_response.text = json.dumps(
+                    {
+                        "fiwiki": {
+                            "scores": {
+                                "12345": {
+                                    model: {
+                                        "score": {
+                                            "prediction": probability > 0.5,
+                                            "probability": {
+                                                "true": probability,
+                                                "false": 1 - probability,
+                                            },
+                                        }
+                                    }
+                                    for model, probability in probabilities.items()
                                 }
                             }
                         }
                     }
-                }
-            }
-        )
-        mock_fetch.return_value = mock_response
+                )
+                self.mock_fetch.return_value = mock_response
 
-        mock_revision = MagicMock()
-        mock_revision.revid = 12345
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.page.wiki.family = "wikipedia"
+                mock_revision = fiwiki_revision_mock()
 
-        context = self._create_context(
-            mock_revision, damaging_threshold=0.7, goodfaith_threshold=0.0
-        )
-        result = check_ores_scores(context)
-
-        self.assertEqual(result.status, "fail")
-        self.assertEqual(result.decision.status, "blocked")
-        self.assertIn("0.850", result.message)
-
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    @patch("reviews.models.ModelScores.objects.create")
-    @patch("reviews.models.ModelScores.objects.get")
-    @patch("reviews.autoreview.utils.ores.http.fetch")
-    def test_ores_goodfaith_score_below_threshold(
-        self, mock_fetch, mock_model_scores_get, mock_model_scores_create, mock_is_living_person
-    ):
-        """Test that low goodfaith score blocks auto-approval."""
-        from reviews.models import ModelScores
-
-        mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
-        mock_model_scores_create.return_value = MagicMock()
-
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_response.text = json.dumps(
-            {
-                "fiwiki": {
-                    "scores": {
-                        "12345": {
-                            "goodfaith": {
-                                "score": {
-                                    "prediction": False,
-                                    "probability": {"true": 0.25, "false": 0.75},
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        )
-        mock_fetch.return_value = mock_response
+                context = self._create_context(
+                    mock_revision, damaging_threshold=damaging, goodfaith_threshold=goodfaith
+                )
+                result = check_ores_scores(context)
 
-        mock_revision = MagicMock()
-        mock_revision.revid = 12345
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.page.wiki.family = "wikipedia"
+                self.assertEqual(result.status, status)
+                if fragment is None:
+                    self.assertIsNone(result.decision)
+                else:
+                    self.assertEqual(result.decision.status, "blocked")
+                    self.assertIn(fragment, result.message)
 
-        context = self._create_context(
-            mock_revision, damaging_threshold=0.0, goodfaith_threshold=0.5
-        )
-        result = check_ores_scores(context)
-
-        self.assertEqual(result.status, "fail")
-        self.assertEqual(result.decision.status, "blocked")
-        self.assertIn("0.250", result.message)
-
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    @patch("reviews.models.ModelScores.objects.create")
-    @patch("reviews.models.ModelScores.objects.get")
-    @patch("reviews.autoreview.utils.ores.http.fetch")
-    def test_ores_scores_within_thresholds(
-        self, mock_fetch, mock_model_scores_get, mock_model_scores_create, mock_is_living_person
-    ):
-        """Test that good scores pass the check."""
-        from reviews.models import ModelScores
-
-        mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
-        mock_model_scores_create.return_value = MagicMock()
-
-        mock_response = Mock()
-        mock_response.headers = {}
-        mock_response.text = json.dumps(
-            {
-                "fiwiki": {
-                    "scores": {
-                        "12345": {
-                            "damaging": {
-                                "score": {
-                                    "prediction": False,
-                                    "probability": {"true": 0.15, "false": 0.85},
-                                }
-                            },
-                            "goodfaith": {
-                                "score": {
-                                    "prediction": True,
-                                    "probability": {"true": 0.85, "false": 0.15},
-                                }
-                            },
-                        }
-                    }
-                }
-            }
-        )
-        mock_fetch.return_value = mock_response
-
-        mock_revision = MagicMock()
-        mock_revision.revid = 12345
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.page.wiki.family = "wikipedia"
-
-        context = self._create_context(
-            mock_revision, damaging_threshold=0.7, goodfaith_threshold=0.5
-        )
-        result = check_ores_scores(context)
-
-        self.assertEqual(result.status, "ok")
-        self.assertIsNone(result.decision)
-
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    def test_ores_checks_disabled_when_thresholds_zero(self, mock_is_living_person):
+    def test_ores_checks_disabled_when_thresholds_zero(self):
         """Test that ORES checks are skipped when thresholds are 0.0."""
 
-        mock_revision = MagicMock()
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.revid = 12345
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.page.wiki.family = "wikipedia"
+        mock_revision = fiwiki_revision_mock()
 
         context = self._create_context(
             mock_revision, damaging_threshold=0.0, goodfaith_threshold=0.0
@@ -211,15 +165,17 @@ class OresScoreTests(TestCase):
         self.assertEqual(result.status, "skip")
         self.assertIn("disabled", result.message)
 
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    @patch("reviews.models.ModelScores.objects.create")
-    @patch("reviews.models.ModelScores.objects.get")
-    @patch("reviews.autoreview.utils.ores.http.fetch")
-    def test_ores_scores_are_cached(
-        self, mock_fetch, mock_model_scores_get, mock_model_scores_create, mock_is_living_person
-    ):
+    def test_living_person_lookup_skipped_when_thresholds_match(self):
+        """Test that the living person lookup is skipped when it cannot change thresholds."""
+        mock_revision = fiwiki_revision_mock()
+        self._create_context(mock_revision, damaging_threshold=0.1, goodfaith_threshold=0.9)
+
+        self.assertEqual(get_ores_thresholds(mock_revision), (0.1, 0.9))
+        self.mock_is_living_person.assert_not_called()
+
+    def test_ores_scores_are_cached(self):
         """Test that ORES scores are cached in the database after fetching."""
-        from reviews.models import ModelScores, PendingPage, PendingRevision, Wiki
+        from reviews.models import PendingPage, PendingRevision, Wiki
 
         # Create real models for this test
         wiki = Wiki.objects.create(
@@ -245,9 +201,6 @@ class OresScoreTests(TestCase):
         )
 
         # First call - no cache
-        mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
-        mock_model_scores_create.return_value = MagicMock()
-
         mock_response = Mock()
         mock_response.headers = {}
         mock_response.text = json.dumps(
@@ -272,47 +225,41 @@ class OresScoreTests(TestCase):
                 }
             }
         )
-        mock_fetch.return_value = mock_response
+        self.mock_fetch.return_value = mock_response
 
         context = self._create_context(revision, damaging_threshold=0.7, goodfaith_threshold=0.5)
         result1 = check_ores_scores(context)
 
         # Verify cache was created
-        self.assertTrue(mock_model_scores_create.called)
+        self.assertTrue(self.mock_model_scores_create.called)
         self.assertEqual(result1.status, "ok")
 
-    @patch("reviews.autoreview.utils.ores.logger")
-    @patch("reviews.autoreview.utils.living_person.is_living_person", return_value=False)
-    @patch("reviews.models.ModelScores.objects.create")
-    @patch("reviews.models.ModelScores.objects.get")
-    @patch("reviews.autoreview.utils.ores.http.fetch")
-    def test_ores_scores_api_error_fails(
-        self,
-        mock_fetch,
-        mock_model_scores_get,
-        mock_model_scores_create,
-        mock_is_living_person,
-        mock_logger,
-    ):
+    def test_ores_scores_api_error_fails(self):
         """Test that when ORES API fails, check fails."""
-        from reviews.models import ModelScores
-
-        mock_model_scores_get.side_effect = ModelScores.DoesNotExist()
-        mock_model_scores_create.return_value = MagicMock()
-
         # Simulate ORES API error
-        mock_fetch.side_effect = Exception("API error")
+        self.mock_fetch.side_effect = Exception("API error")
 
-        mock_revision = MagicMock()
-        mock_revision.revid = 12345
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.page.wiki.family = "wikipedia"
+        mock_revision = fiwiki_revision_mock()
 
         context = self._create_context(
             mock_revision, damaging_threshold=0.7, goodfaith_threshold=0.5
         )
-        result = check_ores_scores(context)
+        with self.assertLogs("reviews.autoreview.utils.ores", "ERROR"):
+            result = check_ores_scores(context)
 
         self.assertEqual(result.status, "fail")
         self.assertEqual(result.decision.status, "blocked")
         self.assertIn("Could not verify", result.message)
+
+    def test_failed_lookup_is_not_retried_immediately(self):
+        """Test that a failed ORES lookup is not repeated within the retry delay."""
+        self.mock_fetch.side_effect = Exception("API error")
+        mock_revision = fiwiki_revision_mock()
+
+        with self.assertLogs("reviews.autoreview.utils.ores", "ERROR"):
+            first = get_ores_scores(mock_revision, check_damaging=True, check_goodfaith=True)
+        second = get_ores_scores(mock_revision, check_damaging=True, check_goodfaith=True)
+
+        self.assertEqual(first, (None, None))
+        self.assertEqual(second, (None, None))
+        self.assertEqual(self.mock_fetch.call_count, 1)
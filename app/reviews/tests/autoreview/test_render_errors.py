@@ -18,6 +18,7 @@ class RenderErrorsTests(TestCase):
     @patch("reviews.services.wiki_client.pywikibot.Site")
     def test_no_new_render_errors(self, mock_site):
         """Test check passes when no new render errors are introduced."""
+        now = datetime.now(timezone.utc)
         wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
@@ -39,8 +40,8 @@ class RenderErrorsTests(TestCase):
             parentid=100,
             user_name="Editor",
             user_id=1,
-            timestamp=datetime.now(timezone.utc),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now,
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="test",
             comment="Test edit",
@@ -2,16 +2,29 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from reviews.autoreview.utils.similarity import is_addition_superseded
-from reviews.autoreview.utils.wikitext import extract_additions, normalize_wikitext
+from reviews.autoreview.utils.wikitext import (
+    extract_additions,
+    get_parent_wikitext,
+    normalize_wikitext,
+)
+from reviews.models import PendingPage, PendingRevision, Wiki, WikiConfiguration
 
 
-class SupersededAdditionsTests(TestCase):
-    """Test suite for superseded additions detection."""
+def parentless_revision(parent_wikitext: str, wikitext: str) -> PendingRevision:
+    """Build an unsaved, parentless revision whose parent wikitext is already cached."""
+    revision = PendingRevision(revid=101, wikitext=wikitext)
+    revision.parent_wikitext = parent_wikitext
+    return revision
+
+
+class SupersededAdditionsTextTests(SimpleTestCase):
+    """Tests for the text helpers behind superseded additions, which need no database."""
 
     def test_normalize_wikitext(self):
         """Test that wikitext normalization removes markup correctly."""
@@ -47,76 +60,120 @@ class SupersededAdditionsTests(TestCase):
         additions = extract_additions(parent, pending)
         self.assertGreaterEqual(len(additions), 2)
 
+    def test_extract_additions_small_edit_to_long_page(self):
+        """Only the inserted text is extracted from a long, irregular page."""
+        words = ["alpha", "beta", "gamma", "[[link]]", "{{cite}}", "the", "of", "."]
+        # Quadratic residues give a long word sequence without short repeats.
+        parent = " ".join(words[i * i % 997 % len(words)] for i in range(2000))
+        pending = parent[:5000] + " Newly added sentence." + parent[5000:]
+        self.assertEqual(extract_additions(parent, pending), [" Newly added sentence."])
+
     def test_is_addition_superseded_fully_removed(self):
         """Test case 1: Addition was fully removed in current stable."""
-        mock_revision = MagicMock()
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.parent_wikitext = "Original text"
-        mock_revision.wikitext = "Original text New addition here"
-        mock_revision.get_wikitext.return_value = "Original text New addition here"
-        mock_revision.parentid = None
+        revision = parentless_revision("Original text", "Original text New addition here")
 
         current_stable = "Original text"
         threshold = 0.7
 
-        result = is_addition_superseded(mock_revision, current_stable, threshold)
+        result = is_addition_superseded(revision, current_stable, threshold)
 
         self.assertTrue(result)
 
     def test_is_addition_superseded_partially_removed(self):
         """Test case 2: Addition was partially removed (majority removed)."""
-        mock_revision = MagicMock()
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.parent_wikitext = "Original text."
-        mock_revision.wikitext = "Original text. Addition of many words and sentences here."
-        mock_revision.get_wikitext.return_value = (
-            "Original text. Addition of many words and sentences here."
+        revision = parentless_revision(
+            "Original text.", "Original text. Addition of many words and sentences here."
         )
-        mock_revision.parentid = None
 
         current_stable = "Original text. Addition of"
         threshold = 0.7
 
-        result = is_addition_superseded(mock_revision, current_stable, threshold)
+        result = is_addition_superseded(revision, current_stable, threshold)
 
         self.assertTrue(result)
 
     def test_is_addition_superseded_content_still_present(self):
         """Test case 4: Addition content is still largely present (not superseded)."""
-        mock_revision = MagicMock()
-        mock_revision.page.wiki.code = "fi"
-        mock_revision.parent_wikitext = "Original text."
-        mock_revision.wikitext = "Original text. New section with important details."
-        mock_revision.get_wikitext.return_value = (
-            "Original text. New section with important details."
+        revision = parentless_revision(
+            "Original text.", "Original text. New section with important details."
         )
-        mock_revision.parentid = None  # No parent means extract_additions will return the full text
 
         current_stable = "Original text. New section with important details."
         threshold = 0.7
 
-        result = is_addition_superseded(mock_revision, current_stable, threshold)
+        result = is_addition_superseded(revision, current_stable, threshold)
         self.assertFalse(result["is_superseded"])
 
-    def test_check_superseded_additions_with_approval(self):
-        """Test check_superseded_additions returns approval when content is superseded."""
-        from datetime import datetime, timedelta, timezone
+    def test_is_addition_superseded_reuses_stable_text_across_revisions(self):
+        """Stable text shared by several pending revisions is normalized only once."""
+        current_stable = "Original text. Shared stable paragraph for every revision."
+        revisions = [
+            parentless_revision("Original text.", f"Original text. {addition}")
+            for addition in ("First addition here", "Second addition here")
+        ]
 
-        from reviews.autoreview.checks.superseded_additions import check_superseded_additions
-        from reviews.autoreview.context import CheckContext
-        from reviews.models import PendingPage, PendingRevision, Wiki, WikiConfiguration
+        with patch(
+            "reviews.autoreview.utils.similarity.normalize_wikitext",
+            wraps=normalize_wikitext,
+        ) as mock_normalize:
+            results = [
+                is_addition_superseded(revision, current_stable, 0.7) for revision in revisions
+            ]
 
-        # Create test data
-        wiki = Wiki.objects.create(
+        stable_calls = [c for c in mock_normalize.call_args_list if c.args == (current_stable,)]
+        self.assertEqual(len(stable_calls), 1)
+        self.assertTrue(all(result["is_superseded"] for result in results))
+
+
+class SupersededAdditionsTests(TestCase):
+    """Test suite for superseded additions detection."""
+
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        WikiConfiguration.objects.create(wiki=wiki, superseded_similarity_threshold=0.7)
+        WikiConfiguration.objects.create(wiki=cls.wiki, superseded_similarity_threshold=0.7)
+
+    def test_get_parent_wikitext_is_loaded_once_per_revision(self):
+        """The parent text is kept on the revision for the checks that read it after."""
+        page = PendingPage.objects.create(
+            wiki=self.wiki, pageid=2, title="Parent Page", stable_revid=100
+        )
+        PendingRevision.objects.create(
+            page=page,
+            revid=100,
+            parentid=None,
+            user_name="Editor",
+            user_id=1,
+            timestamp=datetime.now(timezone.utc) - timedelta(days=1),
+            age_at_fetch=timedelta(days=1),
+            sha1="parent",
+            comment="Parent version",
+            change_tags=[],
+            wikitext="Parent text",
+            categories=[],
+        )
+        revision = PendingRevision(page=page, revid=101, parentid=100)
+
+        with self.assertNumQueries(1):
+            texts = [get_parent_wikitext(revision), get_parent_wikitext(revision)]
+
+        self.assertEqual(texts, ["Parent text", "Parent text"])
+
+    def test_check_superseded_additions_with_approval(self):
+        """Test check_superseded_additions returns approval when content is superseded."""
+        now = datetime.now(timezone.utc)
+        from reviews.autoreview.checks.superseded_additions import check_superseded_additions
+        from reviews.autoreview.context import CheckContext
 
         page = PendingPage.objects.create(
-            wiki=wiki,
+            wiki=self.wiki,
             pageid=1,
             title="Test Page",
             stable_revid=100,
@@ -129,8 +186,8 @@ class SupersededAdditionsTests(TestCase):
             parentid=99,
             user_name="StableUser",
             user_id=1,
-            timestamp=datetime.now(timezone.utc) - timedelta(days=2),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(days=2),
+            fetched_at=now,
             age_at_fetch=timedelta(days=2),
             sha1="stable",
             comment="Stable version",
@@ -146,8 +203,8 @@ class SupersededAdditionsTests(TestCase):
             parentid=100,
             user_name="Editor",
             user_id=2,
-            timestamp=datetime.now(timezone.utc) - timedelta(days=1),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(days=1),
+            fetched_at=now,
             age_at_fetch=timedelta(days=1),
             sha1="pending",
             comment="Added content that was later removed",
@@ -172,8 +229,7 @@ class SupersededAdditionsTests(TestCase):
         self.assertEqual(result.decision.status, "approve")
         self.assertTrue(result.should_stop)
 
-    @patch("reviews.autoreview.checks.superseded_additions.logger")
-    def test_check_superseded_additions_exception_handling(self, mock_logger):
+    def test_check_superseded_additions_exception_handling(self):
         """Test check_superseded_additions handles exceptions gracefully."""
         from reviews.autoreview.checks.superseded_additions import check_superseded_additions
         from reviews.autoreview.context import CheckContext
@@ -192,29 +248,19 @@ class SupersededAdditionsTests(TestCase):
             redirect_aliases=[],
         )
 
-        result = check_superseded_additions(context)
+        with self.assertLogs("reviews.autoreview.checks.superseded_additions", "ERROR"):
+            result = check_superseded_additions(context)
         self.assertEqual(result.status, "not_ok")
         self.assertIn("Could not verify", result.message)
 
     def test_check_superseded_additions_not_superseded(self):
         """Test check_superseded_additions returns not_ok when content not superseded."""
-        from datetime import datetime, timedelta, timezone
-
+        now = datetime.now(timezone.utc)
         from reviews.autoreview.checks.superseded_additions import check_superseded_additions
         from reviews.autoreview.context import CheckContext
-        from reviews.models import PendingPage, PendingRevision, Wiki, WikiConfiguration
-
-        # Create test data
-        wiki = Wiki.objects.create(
-            name="Test Wiki",
-            code="test",
-            family="wikipedia",
-            api_endpoint="https://test.wikipedia.org/w/api.php",
-        )
-        WikiConfiguration.objects.create(wiki=wiki, superseded_similarity_threshold=0.7)
 
         page = PendingPage.objects.create(
-            wiki=wiki,
+            wiki=self.wiki,
             pageid=10,
             title="Test Page",
             stable_revid=1000,
@@ -227,8 +273,8 @@ class SupersededAdditionsTests(TestCase):
             parentid=999,
             user_name="StableUser",
             user_id=1,
-            timestamp=datetime.now(timezone.utc) - timedelta(days=2),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(days=2),
+            fetched_at=now,
             age_at_fetch=timedelta(days=2),
             sha1="stable",
             comment="Stable version",
@@ -244,8 +290,8 @@ class SupersededAdditionsTests(TestCase):
             parentid=999,
             user_name="Editor",
             user_id=2,
-            timestamp=datetime.now(timezone.utc) - timedelta(days=1),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(days=1),
+            fetched_at=now,
             age_at_fetch=timedelta(days=1),
             sha1="pending",
             comment="Added content that is still there",
@@ -2,191 +2,104 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from datetime import datetime, timezone
+from itertools import count
+from unittest.mock import MagicMock, Mock, create_autospec, patch, seal
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.autoreview.runner import run_checks_pipeline
+from reviews.services import WikiClient
 
+EDIT_TIMESTAMP = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
 
-class AutoreviewTimingTests(TestCase):
-    """Test that timing information is captured correctly."""
-
-    def test_checks_include_duration_ms(self):
-        """Test that each check result includes duration_ms field."""
-        # Setup mocks
-        mock_wiki = MagicMock()
-        mock_wiki.code = "en"
-        mock_wiki.family = "wikipedia"
-        mock_wiki.configuration = MagicMock()
-        mock_wiki.configuration.enabled_checks = ["broken-wikicode"]  # Run only one check
-
-        mock_page = MagicMock()
-        mock_page.wiki = mock_wiki
-        mock_page.categories = []
-
-        revision = MagicMock()
-        revision.page = mock_page
-        revision.user_name = "TestUser"
-        revision.wikitext = "Some test content"
-        revision.superset_data = {}
-        revision.parentid = None  # No parent revision
-        revision.change_tags = []
-        revision.get_rendered_html.return_value = "<p>Test content</p>"
-
-        mock_client = MagicMock()
-        mock_profile = MagicMock()
-
-        # Run the pipeline
-        result = run_checks_pipeline(
-            revision=revision,
-            client=mock_client,
-            profile=mock_profile,
-            auto_groups={},
-            blocking_categories={},
-            redirect_aliases=[],
-        )
 
-        # Assert that tests have duration_ms
-        self.assertIn("tests", result)
-        self.assertGreater(len(result["tests"]), 0)
-
-        for test in result["tests"]:
-            self.assertIn("duration_ms", test)
-            self.assertIsInstance(test["duration_ms"], float)
-            self.assertGreaterEqual(test["duration_ms"], 0)
-
-    def test_pipeline_includes_total_duration_ms(self):
-        """Test that pipeline result includes total_duration_ms field."""
-        # Setup mocks
-        mock_wiki = MagicMock()
-        mock_wiki.code = "en"
-        mock_wiki.family = "wikipedia"
-        mock_wiki.configuration = MagicMock()
-        mock_wiki.configuration.enabled_checks = ["broken-wikicode", "manual-unapproval"]
-
-        mock_page = MagicMock()
-        mock_page.wiki = mock_wiki
-        mock_page.categories = []
-
-        revision = MagicMock()
-        revision.page = mock_page
-        revision.user_name = "TestUser"
-        revision.wikitext = "Some test content"
-        revision.superset_data = {}
-        revision.parentid = None
-        revision.change_tags = []
-        revision.get_rendered_html.return_value = "<p>Test content</p>"
-
-        mock_client = MagicMock()
-        mock_client.has_manual_unapproval.return_value = False
-
-        mock_profile = MagicMock()
-
-        # Run the pipeline
-        result = run_checks_pipeline(
-            revision=revision,
-            client=mock_client,
-            profile=mock_profile,
-            auto_groups={},
-            blocking_categories={},
-            redirect_aliases=[],
-        )
+class AutoreviewTimingTests(SimpleTestCase):
+    """Test that timing information is captured correctly."""
 
-        # Assert that result has total_duration_ms
-        self.assertIn("total_duration_ms", result)
-        self.assertIsInstance(result["total_duration_ms"], float)
-        self.assertGreaterEqual(result["total_duration_ms"], 0)
+    def setUp(self):
+        self.configuration = MagicMock(enabled_checks=None)
 
-    def test_duration_is_reasonable(self):
-        """Test that timing measurements are reasonable (not zero, not huge)."""
-        # Setup mocks
         mock_wiki = MagicMock()
         mock_wiki.code = "en"
         mock_wiki.family = "wikipedia"
-        mock_wiki.configuration = MagicMock()
-        mock_wiki.configuration.enabled_checks = ["broken-wikicode"]
+        mock_wiki.configuration = self.configuration
 
         mock_page = MagicMock()
         mock_page.wiki = mock_wiki
+        mock_page.title = "Test Page"
         mock_page.categories = []
 
-        revision = MagicMock()
-        revision.page = mock_page
-        revision.user_name = "TestUser"
-        revision.wikitext = "Some test content"
-        revision.superset_data = {}
-        revision.parentid = None
-        revision.change_tags = []
-        revision.get_rendered_html.return_value = "<p>Test content</p>"
-
-        mock_client = MagicMock()
-        mock_profile = MagicMock()
-
-        # Run the pipeline
-        result = run_checks_pipeline(
-            revision=revision,
-            client=mock_client,
-            profile=mock_profile,
-            auto_groups={},
-            blocking_categories={},
-            redirect_aliases=[],
+        self.revision = MagicMock()
+        self.revision.page = mock_page
+        self.revision.revid = 101
+        self.revision.user_name = "TestUser"
+        self.revision.timestamp = EDIT_TIMESTAMP
+        self.revision.wikitext = "Some test content"
+        self.revision.superset_data = {}
+        self.revision.parentid = None  # No parent revision
+        self.revision.change_tags = []
+        self.revision.get_rendered_html.return_value = "<p>Test content</p>"
+
+        # Specced so that checks calling a method WikiClient lacks fail loudly.
+        self.wiki_client = create_autospec(WikiClient, instance=True)
+        self.profile = Mock(
+            usergroups=[],
+            is_bot=False,
+            is_former_bot=False,
+            is_autopatrolled=False,
+            is_autoreviewed=False,
         )
 
-        # Assert that durations are reasonable (between 0 and 10000ms)
-        for test in result["tests"]:
-            self.assertGreater(test["duration_ms"], 0)
-            self.assertLess(test["duration_ms"], 10000)  # 10 seconds max
-
-        # Total duration should be at least the sum of individual durations
-        total = result["total_duration_ms"]
-        sum_of_tests = sum(test["duration_ms"] for test in result["tests"])
-        self.assertGreaterEqual(total, sum_of_tests * 0.9)  # Allow 10% tolerance
-
-    def test_early_exit_includes_timing(self):
-        """Test that early exit from blocking check still includes timing data."""
-        # Setup mocks to trigger early exit
-        mock_wiki = MagicMock()
-        mock_wiki.code = "en"
-        mock_wiki.family = "wikipedia"
-        mock_wiki.configuration = MagicMock()
-        mock_wiki.configuration.enabled_checks = None  # All checks
-
-        mock_page = MagicMock()
-        mock_page.wiki = mock_wiki
-        mock_page.categories = []
-
-        revision = MagicMock()
-        revision.page = mock_page
-        revision.user_name = "BlockedUser"
-        revision.wikitext = "Some content"
-        revision.superset_data = {}
-        revision.parentid = None
-        revision.change_tags = []
-        revision.get_rendered_html.return_value = "<p>Test content</p>"
-
-        mock_client = MagicMock()
-        mock_client.has_manual_unapproval.return_value = False
-        mock_client.is_user_blocked_after_edit.return_value = True  # Trigger block
-
-        mock_profile = MagicMock()
-        mock_profile.is_bot = False
-
-        # Run the pipeline
-        result = run_checks_pipeline(
-            revision=revision,
-            client=mock_client,
-            profile=mock_profile,
+        # Sealed, so a check reading an attribute not set up here raises rather than
+        # silently getting a fresh child mock. Existing attributes can still be set.
+        seal(self.revision)
+        seal(self.profile)
+
+    def run_pipeline(self) -> dict:
+        """Run the checks for the test revision with no group, category or alias settings."""
+        return run_checks_pipeline(
+            revision=self.revision,
+            client=self.wiki_client,
+            profile=self.profile,
             auto_groups={},
             blocking_categories={},
             redirect_aliases=[],
         )
 
-        # Assert timing data is present even with early exit
-        self.assertIn("total_duration_ms", result)
-        self.assertIn("tests", result)
-        self.assertGreater(len(result["tests"]), 0)
-
-        # Each test should have duration
-        for test in result["tests"]:
-            self.assertIn("duration_ms", test)
+    def test_results_include_durations(self):
+        """Test that every check result and the pipeline result carry their duration."""
+        self.wiki_client.has_manual_unapproval.return_value = False
+        self.wiki_client.is_user_blocked_after_edit.return_value = True
+
+        cases = {
+            "single check": ["broken-wikicode"],
+            "several checks": ["broken-wikicode", "manual-unapproval"],
+            # All checks; the blocked user check stops the pipeline early.
+            "early exit": None,
+        }
+        for name, enabled_checks in cases.items():
+            with self.subTest(name):
+                self.configuration.enabled_checks = enabled_checks
+
+                result = self.run_pipeline()
+
+                self.assertGreater(len(result["tests"]), 0)
+                for test in result["tests"]:
+                    self.assertIsInstance(test["duration_ns"], int)
+                    self.assertGreaterEqual(test["duration_ns"], 0)
+                self.assertIsInstance(result["total_duration_ns"], int)
+                self.assertGreaterEqual(result["total_duration_ns"], 0)
+
+    def test_durations_are_measured_with_perf_counter_ns(self):
+        """Test that check and pipeline durations are exact perf_counter_ns differences."""
+        self.configuration.enabled_checks = ["broken-wikicode"]
+
+        # Every clock reading advances by half a second.
+        clock = count(0, 500_000_000)
+        with patch("reviews.autoreview.runner.time.perf_counter_ns", side_effect=clock):
+            result = self.run_pipeline()
+
+        # Readings: pipeline start 0.0, check start 0.5, check end 1.0, pipeline end 1.5
+        self.assertEqual([test["duration_ns"] for test in result["tests"]], [500_000_000])
+        self.assertEqual(result["total_duration_ns"], 1_500_000_000)
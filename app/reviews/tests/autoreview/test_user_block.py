@@ -5,14 +5,18 @@ from __future__ import annotations
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.autoreview.checks.user_block import check_user_block
 from reviews.autoreview.context import CheckContext
-from reviews.services import was_user_blocked_after
+from reviews.models import EditorProfile, PendingPage, PendingRevision, Wiki
+from reviews.services import WikiClient, was_user_blocked_after
 
+# Timestamp of the edit under review; datetimes are immutable, so tests share it.
+EDIT_TIMESTAMP = datetime(2024, 1, 15, 10, 0)
 
-class AutoreviewBlockedUserTests(TestCase):
+
+class AutoreviewBlockedUserTests(SimpleTestCase):
     def setUp(self):
         """Clear the LRU cache before each test."""
         was_user_blocked_after.cache_clear()
@@ -21,42 +25,28 @@ class AutoreviewBlockedUserTests(TestCase):
     def test_blocked_user_not_auto_approved(self, mock_site):
         """Test that a user blocked after making an edit is NOT auto-approved."""
         # Mock the pywikibot.Site and logevents to return a block event
-        mock_site_instance = MagicMock()
-        mock_site.return_value = mock_site_instance
-
-        # Create a mock block event
         mock_block_event = MagicMock()
         mock_block_event.action.return_value = "block"
+        mock_site_instance = mock_site.return_value
         mock_site_instance.logevents.return_value = [mock_block_event]
 
-        profile = MagicMock()
-        profile.usergroups = []
-        profile.is_bot = False
-        profile.is_autoreviewed = False
-        profile.is_autopatrolled = False
-
-        mock_wiki = MagicMock()
-        mock_wiki.code = "fi"
-        mock_wiki.family = "wikipedia"
-        mock_wiki.configuration = MagicMock()
-        mock_wiki.configuration.enabled_checks = None  # Run all checks
-
-        revision = MagicMock()
-        revision.user_name = "BlockedUser"
-        revision.timestamp = datetime.fromisoformat("2024-01-15T10:00:00")
-        revision.page.categories = []
-        revision.page.wiki = mock_wiki
-        revision.superset_data = {}
-
-        # Create a mock WikiClient
-        from reviews.services import WikiClient
+        profile = EditorProfile(
+            usergroups=[], is_bot=False, is_autoreviewed=False, is_autopatrolled=False
+        )
+        wiki = Wiki(code="fi", family="wikipedia")
+        revision = PendingRevision(
+            user_name="BlockedUser",
+            timestamp=EDIT_TIMESTAMP,
+            page=PendingPage(categories=[], wiki=wiki),
+            superset_data={},
+        )
 
-        mock_client = WikiClient(mock_wiki)
+        client = WikiClient(wiki)
 
         # Create context
         context = CheckContext(
             revision=revision,
-            client=mock_client,
+            client=client,
             profile=profile,
             auto_groups={},
             blocking_categories={},
@@ -77,17 +67,13 @@ class AutoreviewBlockedUserTests(TestCase):
         # Verify logevents was called with correct parameters
         mock_site_instance.logevents.assert_called_once()
 
-    @patch("reviews.autoreview.checks.user_block.logger")
-    def test_blocked_user_check_handles_exception(self, mock_logger):
+    def test_blocked_user_check_handles_exception(self):
         """Test that user block check handles exceptions gracefully."""
-        mock_wiki = MagicMock()
-        mock_wiki.code = "en"
-        mock_wiki.family = "wikipedia"
-
-        revision = MagicMock()
-        revision.user_name = "TestUser"
-        revision.timestamp = datetime.fromisoformat("2024-01-15T10:00:00")
-        revision.page.wiki = mock_wiki
+        revision = PendingRevision(
+            user_name="TestUser",
+            timestamp=EDIT_TIMESTAMP,
+            page=PendingPage(wiki=Wiki(code="en", family="wikipedia")),
+        )
 
         # Create a mock client that raises exception
         mock_client = MagicMock()
@@ -102,7 +88,8 @@ class AutoreviewBlockedUserTests(TestCase):
             redirect_aliases=[],
         )
 
-        result = check_user_block(context)
+        with self.assertLogs("reviews.autoreview.checks.user_block", "ERROR"):
+            result = check_user_block(context)
 
         # Should handle exception and return fail status
         self.assertEqual(result.status, "fail")
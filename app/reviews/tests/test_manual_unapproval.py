@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
-from django.test import Client, TestCase
+from django.test import TestCase
 from django.urls import reverse
 
 from reviews.models import (
@@ -13,26 +13,76 @@ from reviews.models import (
     Wiki,
     WikiConfiguration,
 )
+from reviews.services import WikiClient
+
+
+def review_event(logid: int, action: str, timestamp: str, revid: int) -> dict:
+    """Build a review log event as returned by the logevents API."""
+    return {"logid": logid, "action": action, "timestamp": timestamp, "params": {"0": revid}}
+
+
+class FakeRequest:
+    def __init__(self, data):
+        self._data = data
+
+    def submit(self):
+        return self._data
+
+
+class FakeLogSite:
+    """Site whose API requests return a fixed list of review log events."""
+
+    def __init__(self, log_events):
+        self._response = {"query": {"logevents": log_events}}
+
+    def logevents(self, **kwargs):
+        """Mock logevents for block checking."""
+        return []
+
+    def simple_request(self, **kwargs):
+        return FakeRequest(self._response)
 
 
 class ManualUnapprovalTests(TestCase):
     """Tests for manual un-approval check in autoreview functionality."""
 
-    def setUp(self):
-        self.client = Client()
-        self.wiki = Wiki.objects.create(
+    mock_has_unapproval: mock.MagicMock
+    wiki: Wiki
+    config: WikiConfiguration
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Keep code paths that are not mocked per test from reaching a live wiki.
+        site_patcher = mock.patch("pywikibot.Site", return_value=FakeLogSite([]))
+        site_patcher.start()
+        cls.addClassCleanup(site_patcher.stop)
+
+        html_patcher = mock.patch.object(
+            PendingRevision, "get_rendered_html", return_value="<p>Clean HTML</p>"
+        )
+        html_patcher.start()
+        cls.addClassCleanup(html_patcher.stop)
+
+        # Tests set the return value to choose whether the revision was un-approved.
+        unapproval_patcher = mock.patch("reviews.services.WikiClient.has_manual_unapproval")
+        cls.mock_has_unapproval = unapproval_patcher.start()
+        cls.addClassCleanup(unapproval_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             family="wikipedia",
             api_endpoint="https://test.wikipedia.org/w/api.php",
         )
-        self.config = WikiConfiguration.objects.create(wiki=self.wiki)
+        cls.config = WikiConfiguration.objects.create(wiki=cls.wiki)
 
-    @mock.patch.object(PendingRevision, "get_rendered_html", return_value="<p>Clean HTML</p>")
-    @mock.patch("reviews.services.WikiClient.has_manual_unapproval")
-    def test_manually_unapproved_revision_should_be_blocked(self, mock_has_unapproval, mock_html):
+    def test_manually_unapproved_revision_should_be_blocked(self):
         """Bot should not auto-approve revisions that have been manually un-approved."""
-        mock_has_unapproval.return_value = True
+        now = datetime.now(timezone.utc)
+        self.mock_has_unapproval.return_value = True
 
         page = PendingPage.objects.create(
             wiki=self.wiki,
@@ -56,8 +106,8 @@ class ManualUnapprovalTests(TestCase):
             parentid=100,
             user_name="TestBot",
             user_id=999,
-            timestamp=datetime.now(timezone.utc) - timedelta(hours=1),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(hours=1),
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="abc123",
             comment="Bot edit",
@@ -88,11 +138,10 @@ class ManualUnapprovalTests(TestCase):
         assert manual_unapproval_test is not None  # for mypy
         self.assertEqual(manual_unapproval_test["status"], "fail")
 
-    @mock.patch.object(PendingRevision, "get_rendered_html", return_value="<p>Clean HTML</p>")
-    @mock.patch("reviews.services.WikiClient.has_manual_unapproval")
-    def test_not_manually_unapproved_revision_passes_check(self, mock_has_unapproval, mock_html):
+    def test_not_manually_unapproved_revision_passes_check(self):
         """Revisions without manual un-approval should pass the check."""
-        mock_has_unapproval.return_value = False
+        now = datetime.now(timezone.utc)
+        self.mock_has_unapproval.return_value = False
 
         page = PendingPage.objects.create(
             wiki=self.wiki,
@@ -114,8 +163,8 @@ class ManualUnapprovalTests(TestCase):
             parentid=200,
             user_name="AnotherBot",
             user_id=888,
-            timestamp=datetime.now(timezone.utc) - timedelta(hours=1),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(hours=1),
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="def456",
             comment="Bot edit",
@@ -141,11 +190,10 @@ class ManualUnapprovalTests(TestCase):
 
         self.assertEqual(result["decision"]["status"], "approve")
 
-    @mock.patch.object(PendingRevision, "get_rendered_html", return_value="<p>Clean HTML</p>")
-    @mock.patch("reviews.services.WikiClient.has_manual_unapproval")
-    def test_manual_unapproval_overrides_autoreview_rights(self, mock_has_unapproval, mock_html):
+    def test_manual_unapproval_overrides_autoreview_rights(self):
         """Manual un-approval should block even users with autoreview rights."""
-        mock_has_unapproval.return_value = True
+        now = datetime.now(timezone.utc)
+        self.mock_has_unapproval.return_value = True
 
         self.config.auto_approved_groups = ["autoreviewer"]
         self.config.save(update_fields=["auto_approved_groups"])
@@ -170,8 +218,8 @@ class ManualUnapprovalTests(TestCase):
             parentid=300,
             user_name="TrustedEditor",
             user_id=777,
-            timestamp=datetime.now(timezone.utc) - timedelta(hours=1),
-            fetched_at=datetime.now(timezone.utc),
+            timestamp=now - timedelta(hours=1),
+            fetched_at=now,
             age_at_fetch=timedelta(hours=1),
             sha1="ghi789",
             comment="Important edit",
@@ -194,188 +242,79 @@ class ManualUnapprovalTests(TestCase):
             "Manual un-approval should override autoreview rights",
         )
 
-    @mock.patch("reviews.models.pending_revision.pywikibot.Site")
-    def test_has_manual_unapproval_detects_unapproval(self, mock_site):
+
+class HasManualUnapprovalTests(TestCase):
+    """Tests for WikiClient.has_manual_unapproval against review log events."""
+
+    mock_site: mock.MagicMock
+    wiki: Wiki
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        site_patcher = mock.patch("reviews.models.pending_revision.pywikibot.Site")
+        cls.mock_site = site_patcher.start()
+        cls.addClassCleanup(site_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
+            name="Test Wiki",
+            code="test",
+            family="wikipedia",
+            api_endpoint="https://test.wikipedia.org/w/api.php",
+        )
+
+    def test_has_manual_unapproval_detects_unapproval(self):
         """Test WikiClient.has_manual_unapproval correctly detects un-approvals."""
-        from reviews.services import WikiClient
-
-        class FakeRequest:
-            def __init__(self, data):
-                self._data = data
-
-            def submit(self):
-                return self._data
-
-        class FakeSite:
-            def logevents(self, **kwargs):
-                """Mock logevents for block checking."""
-                return []
-
-            def simple_request(self, **kwargs):
-                return FakeRequest(
-                    {
-                        "query": {
-                            "logevents": [
-                                {
-                                    "logid": 12345,
-                                    "action": "unapprove",
-                                    "timestamp": "2025-10-11T10:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                                {
-                                    "logid": 12344,
-                                    "action": "approve",
-                                    "timestamp": "2025-10-11T09:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                            ]
-                        }
-                    }
-                )
-
-        fake_site = FakeSite()
-        mock_site.return_value = fake_site
+        self.mock_site.return_value = FakeLogSite(
+            [
+                review_event(12345, "unapprove", "2025-10-11T10:00:00Z", 101),
+                review_event(12344, "approve", "2025-10-11T09:00:00Z", 101),
+            ]
+        )
 
         client = WikiClient(self.wiki)
         result = client.has_manual_unapproval("Test Page", 101)
 
         self.assertTrue(result, "Should detect manual un-approval")
 
-    @mock.patch("reviews.models.pending_revision.pywikibot.Site")
-    def test_has_manual_unapproval_returns_false_when_no_unapproval(self, mock_site):
+    def test_has_manual_unapproval_returns_false_when_no_unapproval(self):
         """Test WikiClient.has_manual_unapproval returns False when no un-approval exists."""
-        from reviews.services import WikiClient
-
-        class FakeRequest:
-            def __init__(self, data):
-                self._data = data
-
-            def submit(self):
-                return self._data
-
-        class FakeSite:
-            def logevents(self, **kwargs):
-                """Mock logevents for block checking."""
-                return []
-
-            def simple_request(self, **kwargs):
-                return FakeRequest(
-                    {
-                        "query": {
-                            "logevents": [
-                                {
-                                    "logid": 12346,
-                                    "action": "approve",
-                                    "timestamp": "2025-10-11T11:00:00Z",
-                                    "params": {"0": 102},
-                                },
-                                {
-                                    "logid": 12345,
-                                    "action": "approve",
-                                    "timestamp": "2025-10-11T10:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                            ]
-                        }
-                    }
-                )
-
-        fake_site = FakeSite()
-        mock_site.return_value = fake_site
+        self.mock_site.return_value = FakeLogSite(
+            [
+                review_event(12346, "approve", "2025-10-11T11:00:00Z", 102),
+                review_event(12345, "approve", "2025-10-11T10:00:00Z", 101),
+            ]
+        )
 
         client = WikiClient(self.wiki)
         result = client.has_manual_unapproval("Test Page", 101)
 
         self.assertFalse(result, "Should return False when no un-approval exists")
 
-    @mock.patch("reviews.models.pending_revision.pywikibot.Site")
-    def test_has_manual_unapproval_checks_correct_revision(self, mock_site):
+    def test_has_manual_unapproval_checks_correct_revision(self):
         """Test that has_manual_unapproval only returns True for the specific revision."""
-        from reviews.services import WikiClient
-
-        class FakeRequest:
-            def __init__(self, data):
-                self._data = data
-
-            def submit(self):
-                return self._data
-
-        class FakeSite:
-            def logevents(self, **kwargs):
-                """Mock logevents for block checking."""
-                return []
-
-            def simple_request(self, **kwargs):
-                return FakeRequest(
-                    {
-                        "query": {
-                            "logevents": [
-                                {
-                                    "logid": 12347,
-                                    "action": "unapprove",
-                                    "timestamp": "2025-10-11T12:00:00Z",
-                                    "params": {"0": 999},
-                                }
-                            ]
-                        }
-                    }
-                )
-
-        fake_site = FakeSite()
-        mock_site.return_value = fake_site
+        self.mock_site.return_value = FakeLogSite(
+            [
+                review_event(12347, "unapprove", "2025-10-11T12:00:00Z", 999),
+            ]
+        )
 
         client = WikiClient(self.wiki)
         result = client.has_manual_unapproval("Test Page", 101)
 
         self.assertFalse(result, "Should return False when un-approval is for a different revision")
 
-    @mock.patch("reviews.models.pending_revision.pywikibot.Site")
-    def test_later_approval_overrides_earlier_unapproval(self, mock_site):
+    def test_later_approval_overrides_earlier_unapproval(self):
         """If revision was un-approved then re-approved, should return False."""
-        from reviews.services import WikiClient
-
-        class FakeRequest:
-            def __init__(self, data):
-                self._data = data
-
-            def submit(self):
-                return self._data
-
-        class FakeSite:
-            def logevents(self, **kwargs):
-                """Mock logevents for block checking."""
-                return []
-
-            def simple_request(self, **kwargs):
-                return FakeRequest(
-                    {
-                        "query": {
-                            "logevents": [
-                                {
-                                    "logid": 12350,
-                                    "action": "approve",
-                                    "timestamp": "2025-10-12T10:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                                {
-                                    "logid": 12349,
-                                    "action": "unapprove",
-                                    "timestamp": "2025-10-11T10:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                                {
-                                    "logid": 12348,
-                                    "action": "approve",
-                                    "timestamp": "2025-10-10T10:00:00Z",
-                                    "params": {"0": 101},
-                                },
-                            ]
-                        }
-                    }
-                )
-
-        fake_site = FakeSite()
-        mock_site.return_value = fake_site
+        self.mock_site.return_value = FakeLogSite(
+            [
+                review_event(12350, "approve", "2025-10-12T10:00:00Z", 101),
+                review_event(12349, "unapprove", "2025-10-11T10:00:00Z", 101),
+                review_event(12348, "approve", "2025-10-10T10:00:00Z", 101),
+            ]
+        )
 
         client = WikiClient(self.wiki)
         result = client.has_manual_unapproval("Test Page", 101)
@@ -384,41 +323,13 @@ class ManualUnapprovalTests(TestCase):
             result, "Should return False when most recent action is approval (not unapproval)"
         )
 
-    @mock.patch("reviews.models.pending_revision.pywikibot.Site")
-    def test_detects_quality_unapproval(self, mock_site):
+    def test_detects_quality_unapproval(self):
         """Test that unapprove2 (quality un-approval) is also detected."""
-        from reviews.services import WikiClient
-
-        class FakeRequest:
-            def __init__(self, data):
-                self._data = data
-
-            def submit(self):
-                return self._data
-
-        class FakeSite:
-            def logevents(self, **kwargs):
-                """Mock logevents for block checking."""
-                return []
-
-            def simple_request(self, **kwargs):
-                return FakeRequest(
-                    {
-                        "query": {
-                            "logevents": [
-                                {
-                                    "logid": 12351,
-                                    "action": "unapprove2",
-                                    "timestamp": "2025-10-13T10:00:00Z",
-                                    "params": {"0": 102},
-                                }
-                            ]
-                        }
-                    }
-                )
-
-        fake_site = FakeSite()
-        mock_site.return_value = fake_site
+        self.mock_site.return_value = FakeLogSite(
+            [
+                review_event(12351, "unapprove2", "2025-10-13T10:00:00Z", 102),
+            ]
+        )
 
         client = WikiClient(self.wiki)
         result = client.has_manual_unapproval("Test Page", 102)
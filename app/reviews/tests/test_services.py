@@ -43,12 +43,17 @@ class FakeSite:
 
 
 class WikiClientTests(TestCase):
-    def setUp(self):
-        self.wiki = Wiki.objects.create(
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
             name="Test Wiki",
             code="test",
             api_endpoint="https://test.example/api.php",
         )
+
+    def setUp(self):
         self.fake_site = FakeSite()
         self.site_patcher = mock.patch(
             "reviews.services.wiki_client.pywikibot.Site",
@@ -233,18 +238,31 @@ class RefreshWorkflowTests(TestCase):
 class FormerBotTests(TestCase):
     """Test cases for former bot detection and handling."""
 
+    wiki: Wiki
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        site_patcher = mock.patch("reviews.services.wiki_client.pywikibot.Site")
+        site_patcher.start()
+        cls.addClassCleanup(site_patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(code="fi", family="wikipedia")
+
+    def setUp(self):
+        self.wiki_client = WikiClient(self.wiki)
+
     def test_ensure_editor_profile_with_former_bot_group(self):
         """Test that former bot group is properly detected."""
-        wiki = Wiki.objects.create(code="fi", family="wikipedia")
-        client = WikiClient(wiki)
-
         superset_data = {
             "user_groups": ["autoconfirmed"],
             "user_former_groups": ["bot"],
             "rc_bot": False,
         }
 
-        profile = client.ensure_editor_profile("FormerBotUser", superset_data)
+        profile = self.wiki_client.ensure_editor_profile("FormerBotUser", superset_data)
 
         self.assertFalse(profile.is_bot)
         self.assertTrue(profile.is_former_bot)
@@ -252,42 +270,33 @@ class FormerBotTests(TestCase):
 
     def test_ensure_editor_profile_with_current_and_former_bot(self):
         """Test user who is both current and former bot (edge case)."""
-        wiki = Wiki.objects.create(code="fi", family="wikipedia")
-        client = WikiClient(wiki)
-
         superset_data = {
             "user_groups": ["bot", "autoconfirmed"],
             "user_former_groups": ["bot"],  # Can happen if removed and re-added
             "rc_bot": True,
         }
 
-        profile = client.ensure_editor_profile("ReinstatedBot", superset_data)
+        profile = self.wiki_client.ensure_editor_profile("ReinstatedBot", superset_data)
 
         self.assertTrue(profile.is_bot)
         self.assertTrue(profile.is_former_bot)
 
     def test_ensure_editor_profile_without_former_groups(self):
         """Test that missing former groups doesn't cause issues."""
-        wiki = Wiki.objects.create(code="fi", family="wikipedia")
-        client = WikiClient(wiki)
-
         superset_data = {
             "user_groups": ["autoconfirmed"],
             "user_former_groups": [],
             "rc_bot": False,
         }
 
-        profile = client.ensure_editor_profile("RegularUser", superset_data)
+        profile = self.wiki_client.ensure_editor_profile("RegularUser", superset_data)
 
         self.assertFalse(profile.is_bot)
         self.assertFalse(profile.is_former_bot)
 
     def test_ensure_editor_profile_former_bot_no_superset_data(self):
         """Test that profile defaults work when no superset data provided."""
-        wiki = Wiki.objects.create(code="fi", family="wikipedia")
-        client = WikiClient(wiki)
-
-        profile = client.ensure_editor_profile("SomeUser", None)
+        profile = self.wiki_client.ensure_editor_profile("SomeUser", None)
 
         self.assertFalse(profile.is_bot)
         self.assertFalse(profile.is_former_bot)
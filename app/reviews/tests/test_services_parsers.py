@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from datetime import timezone
-from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from reviews.services.parsers import (
     parse_categories,
@@ -15,7 +14,7 @@ from reviews.services.parsers import (
 )
 
 
-class ParsersTests(TestCase):
+class ParsersTests(SimpleTestCase):
     def test_parse_categories(self):
         wikitext = "Some text [[Category:Foo]] more text [[Category:Bar]]"
         result = parse_categories(wikitext)
@@ -44,14 +43,14 @@ class ParsersTests(TestCase):
         self.assertEqual(result.day, 1)
         self.assertEqual(result.hour, 12)
 
-    @patch("reviews.services.parsers.logger")
-    def test_parse_superset_timestamp_invalid_14_digit(self, mock_logger):
-        result = parse_superset_timestamp("99999999999999")
+    def test_parse_superset_timestamp_invalid_14_digit(self):
+        with self.assertLogs("reviews.services.parsers", "WARNING"):
+            result = parse_superset_timestamp("99999999999999")
         self.assertIsNone(result)
 
-    @patch("reviews.services.parsers.logger")
-    def test_parse_superset_timestamp_invalid_format(self, mock_logger):
-        result = parse_superset_timestamp("invalid-timestamp")
+    def test_parse_superset_timestamp_invalid_format(self):
+        with self.assertLogs("reviews.services.parsers", "WARNING"):
+            result = parse_superset_timestamp("invalid-timestamp")
         self.assertIsNone(result)
 
     def test_parse_superset_timestamp_none(self):
@@ -79,31 +78,19 @@ class ParsersTests(TestCase):
         self.assertIsNone(result)
 
     def test_parse_superset_bool_true_values(self):
-        for value in ["1", "true", "t", "yes", "y", "True", "YES"]:
-            result = parse_superset_bool(value)
-            self.assertTrue(result, f"Failed for value: {value}")
+        for value in ["1", "true", "t", "yes", "y", "True", "YES", 1, 2.5, True]:
+            with self.subTest(value=value):
+                self.assertIs(parse_superset_bool(value), True)
 
     def test_parse_superset_bool_false_values(self):
-        for value in ["0", "false", "f", "no", "n", "False", "NO"]:
-            result = parse_superset_bool(value)
-            self.assertFalse(result, f"Failed for value: {value}")
+        for value in ["0", "false", "f", "no", "n", "False", "NO", 0, False]:
+            with self.subTest(value=value):
+                self.assertIs(parse_superset_bool(value), False)
 
     def test_parse_superset_bool_none_values(self):
-        result = parse_superset_bool(None)
-        self.assertIsNone(result)
-        result = parse_superset_bool("")
-        self.assertIsNone(result)
-        result = parse_superset_bool("null")
-        self.assertIsNone(result)
-
-    def test_parse_superset_bool_numeric(self):
-        self.assertTrue(parse_superset_bool(1))
-        self.assertFalse(parse_superset_bool(0))
-        self.assertTrue(parse_superset_bool(2.5))
-
-    def test_parse_superset_bool_bool(self):
-        self.assertTrue(parse_superset_bool(True))
-        self.assertFalse(parse_superset_bool(False))
+        for value in [None, "", "null"]:
+            with self.subTest(value=value):
+                self.assertIsNone(parse_superset_bool(value))
 
     def test_parse_superset_bool_other(self):
         result = parse_superset_bool("random-string")
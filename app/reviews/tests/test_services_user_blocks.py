@@ -1,28 +1,62 @@
 from __future__ import annotations
 
-from unittest import mock
+from datetime import datetime, timedelta, timezone
+from unittest import addModuleCleanup, mock
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
-from reviews.services.user_blocks import was_user_blocked_after
+from reviews.autoreview.runner import run_autoreview_for_page
+from reviews.models import EditorProfile, PendingPage, PendingRevision, Wiki, WikiConfiguration
+from reviews.services.user_blocks import prefetch_user_blocks, was_user_blocked_after
 
+# pywikibot.Site is patched once for the whole module; tests configure this mock.
+mock_site = mock.MagicMock()
 
-class UserBlocksTests(TestCase):
-    @mock.patch("reviews.services.user_blocks.pywikibot.Site")
-    def test_was_user_blocked_after_false(self, mock_site):
+
+def setUpModule():
+    patcher = mock.patch("reviews.services.user_blocks.pywikibot.Site", mock_site)
+    patcher.start()
+    addModuleCleanup(patcher.stop)
+
+
+class UserBlocksTests(SimpleTestCase):
+    def setUp(self):
+        mock_site.reset_mock(return_value=True, side_effect=True)
+        was_user_blocked_after.cache_clear()
+
+    def test_was_user_blocked_after_false(self):
         mock_site.return_value.logevents.return_value = []
         result = was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
         self.assertFalse(result)
 
-    @mock.patch("reviews.services.user_blocks.logger")
-    @mock.patch("reviews.services.user_blocks.pywikibot.Site")
-    def test_was_user_blocked_after_exception(self, mock_site, mock_logger):
+    def test_was_user_blocked_after_exception(self):
         mock_site.side_effect = Exception("API error")
-        result = was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
+        with self.assertLogs("reviews.services.user_blocks", "ERROR") as logs:
+            result = was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
         self.assertFalse(result)
+        self.assertEqual(len(logs.records), 1)
+
+    def test_failed_lookup_is_retried(self):
+        mock_site.side_effect = [Exception("API error"), mock.DEFAULT]
+        mock_site.return_value.logevents.return_value = []
+        with self.assertLogs("reviews.services.user_blocks", "ERROR"):
+            was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
+        was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
+        was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
+        # The failure is not cached; the successful answer is.
+        self.assertEqual(mock_site.call_count, 2)
+
+    def test_prefetch_user_blocks_fills_cache(self):
+        mock_site.return_value.logevents.return_value = []
+        prefetch_user_blocks(
+            "en", "wikipedia", [("Alice", 2024), ("Bob", 2024), ("Alice", 2024), ("Alice", 2023)]
+        )
+        self.assertEqual(mock_site.return_value.logevents.call_count, 3)
 
-    @mock.patch("reviews.services.user_blocks.pywikibot.Site")
-    def test_was_user_blocked_after_non_block_action(self, mock_site):
+        self.assertFalse(was_user_blocked_after("en", "wikipedia", "Bob", 2024))
+        self.assertEqual(mock_site.return_value.logevents.call_count, 3)
+
+    def test_was_user_blocked_after_non_block_action(self):
         class FakeEvent:
             def action(self):
                 return "unblock"
@@ -30,3 +64,57 @@ class UserBlocksTests(TestCase):
         mock_site.return_value.logevents.return_value = [FakeEvent()]
         result = was_user_blocked_after("en", "wikipedia", "TestUser", 2024)
         self.assertFalse(result)
+
+
+class RunnerBlockPrefetchTests(TestCase):
+    wiki: Wiki
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.wiki = Wiki.objects.create(
+            name="Test Wiki",
+            code="test",
+            family="wikipedia",
+            api_endpoint="https://test.wikipedia.org/w/api.php",
+        )
+        WikiConfiguration.objects.create(
+            wiki=cls.wiki,
+            enabled_checks=["bot-user", "blocked-user"],
+            redirect_aliases=["#REDIRECT"],
+        )
+
+    def setUp(self):
+        mock_site.reset_mock(return_value=True, side_effect=True)
+        mock_site.return_value.logevents.return_value = []
+        was_user_blocked_after.cache_clear()
+
+    def test_bot_edits_are_not_looked_up(self):
+        now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        page = PendingPage.objects.create(wiki=self.wiki, pageid=1, title="Page", stable_revid=1)
+        EditorProfile.objects.create(wiki=self.wiki, username="ProfileBot", is_bot=True)
+        PendingRevision.objects.bulk_create(
+            [
+                PendingRevision(
+                    page=page,
+                    revid=revid,
+                    parentid=revid - 1,
+                    user_name=user_name,
+                    timestamp=now + timedelta(minutes=revid),
+                    age_at_fetch=timedelta(hours=1),
+                    superset_data=superset_data,
+                )
+                for revid, user_name, superset_data in [
+                    (2, "Alice", {}),
+                    (3, "ProfileBot", {}),
+                    (4, "Bob", {}),
+                    (5, "FlaggedBot", {"rc_bot": True}),
+                    (6, "Alice", {}),
+                ]
+            ]
+        )
+
+        results = run_autoreview_for_page(page)
+
+        self.assertEqual(len(results), 5)
+        looked_up = [c.kwargs["page"] for c in mock_site.return_value.logevents.call_args_list]
+        self.assertCountEqual(looked_up, ["User:Alice", "User:Bob"])